@@ -1,10 +1,16 @@
 """Personal agent core module."""
+import importlib
+
 from .task import Task, TaskStatus
 from .memory import TaskRepository, MemoryStore
-from .engine import AgentEngine
-from .executor import ToolExecutor
-from .models import ModelProvider
-from .model_router import ModelRouter
+
+# Heavier modules are imported on first attribute access
+_LAZY_EXPORTS = {
+    "AgentEngine": ".engine",
+    "ToolExecutor": ".executor",
+    "ModelProvider": ".models",
+    "ModelRouter": ".model_router"
+}
 
 __all__ = [
     "Task",
@@ -16,3 +22,12 @@ __all__ = [
     "ModelProvider",
     "ModelRouter"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,25 @@
+"""JSON encoding shared by the persistence and protocol modules."""
+import json
+from typing import Any, Union
+
+try:
+        import orjson
+except ImportError:
+        # Optional speedup; fall back to stdlib json
+        orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+        """Serialize to JSON bytes, compact or indented by two spaces."""
+        if orjson is not None:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        if indent:
+                return json.dumps(data, indent=2).encode("utf-8")
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+        """Parse JSON bytes or text; errors subclass json.JSONDecodeError."""
+        if orjson is not None:
+                return orjson.loads(raw)
+        return json.loads(raw)
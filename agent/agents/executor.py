@@ -72,8 +72,7 @@ class WorkerAgent(BaseAgent):
                         print(f"[WORKER] Using skill: {skill.name} (profile: {self.profile.name})")
 
                         # Set up skill dependencies
-                        skill.tool_registry = self.tool_registry
-                        skill.model_router = self.model_router
+                        skill.bind_registries(self.tool_registry, self.model_router)
 
                         try:
                                 skill_result = skill.execute(task)
@@ -1,5 +1,6 @@
 """Multi-account management for providers."""
 import json
+import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -22,6 +23,12 @@ class AccountManager:
                 except (json.JSONDecodeError, IOError):
                         self._accounts = {}
 
+        # "No cooldown" is stored as 0 so readers can compare without a None check
+        for provider_accounts in self._accounts.values():
+                for account in provider_accounts:
+                        if account.get("cooldown_until") is None:
+                                account["cooldown_until"] = 0
+
     def _save(self):
         """Atomically save accounts to disk."""
         temp_path = self.accounts_path.with_suffix(".tmp")
@@ -50,7 +57,7 @@ class AccountManager:
                 "account_id": account_id,
                 "credentials": credentials,
                 "priority": priority,
-                "cooldown_until": cooldown_until,
+                "cooldown_until": cooldown_until or 0,
                 "created_at": time.time(),
                 "last_used": None,
                 "use_count": 0
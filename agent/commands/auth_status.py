@@ -37,10 +37,10 @@ class AuthStatusCommand(Command):
                 if metrics:
                         health = metrics.get_provider_health(provider_name)
                         status_info.update({
-                                "available": health["available"],
-                                "health_score": health["health_score"],
-                                "total_requests": health["total_requests"],
-                                "in_cooldown": health["in_cooldown"]
+                                "available": health.available,
+                                "health_score": health.health_score,
+                                "total_requests": health.total_requests,
+                                "in_cooldown": health.in_cooldown
                         })
 
                 output_lines = [f"Provider: {status_info['provider']}"]
@@ -202,7 +202,7 @@ class AgentEngine:
                 "status": "healthy",
                 "providers_tracked": len(self.model_metrics._metrics),
                 "total_requests": sum(
-                    data.get("total_requests", 0)
+                    data.total_requests
                     for data in self.model_metrics._metrics.values()
                 )
             }
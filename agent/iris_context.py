@@ -16,6 +16,10 @@ from agent.task import Task, TaskStatus
 from agent.memory import TaskRepository
 from agent.model_router import ModelRouter
 
+# Shared codec instances, reused across every context/journal read and write
+_JSON_DECODER = json.JSONDecoder()
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
 
 @dataclass
 class ContextProject:
@@ -118,6 +122,7 @@ class ContextManager:
         self.journal_path = self.context_dir / 'journal.json'
         self.checkpoints_dir = self.context_dir / 'checkpoints'
         self.lock_path = self.context_dir / '.lock'
+        self._meta_cache: Optional[Meta] = None
 
         self.context_dir.mkdir(exist_ok=True)
         self.checkpoints_dir.mkdir(exist_ok=True)
@@ -156,15 +161,17 @@ class ContextManager:
                 raise FileNotFoundError("Context not initialized. Run 'agent iris-new <project>' first.")
 
             with open(self.context_path, 'r') as f:
-                data = json.load(f)
+                data = _JSON_DECODER.decode(f.read())
 
             # Convert back to dataclass
-            return Context(
+            context = Context(
                 project=ContextProject(**data['project']),
                 current_task=CurrentTask(**data['current_task']) if data.get('current_task') else None,
                 policy=Policy(**data['policy']),
                 meta=Meta(**data['meta'])
             )
+            self._meta_cache = context.meta
+            return context
 
     def write_context(self, context: Context) -> None:
         """Write context atomically"""
@@ -178,7 +185,7 @@ class ContextManager:
             return Journal(entries=[])
 
         with open(self.journal_path, 'r') as f:
-            data = json.load(f)
+            data = _JSON_DECODER.decode(f.read())
 
         return Journal(entries=[
             JournalEntry(**entry) for entry in data['entries']
@@ -186,10 +193,12 @@ class ContextManager:
 
     def write_journal(self, journal: Journal) -> None:
         """Write journal with compaction if needed"""
+        # Resolve meta before taking the lock; load_context() acquires it too
+        meta = self._get_meta()
         with self._acquire_lock():
             # Check if compaction needed
-            if len(journal.entries) > self.load_context().meta.compact_after:
-                self._compact_journal(journal)
+            if len(journal.entries) > meta.compact_after:
+                self._compact_journal(journal, meta)
 
             self._write_journal(journal)
 
@@ -220,14 +229,23 @@ class ContextManager:
         checkpoint_path = checkpoint_dir / f"{Path(file_path).name}.orig.{timestamp}"
 
         if Path(file_path).exists():
-            import shutil
-            shutil.copy2(file_path, checkpoint_path)
+            # Hardlink is a metadata-only op; edits replace the file rather
+            # than rewriting it in place, so the link keeps the original bytes
+            try:
+                os.link(file_path, checkpoint_path)
+            except OSError:
+                # Cross-device or filesystem without hardlink support
+                import shutil
+                shutil.copy2(file_path, checkpoint_path)
 
         return str(checkpoint_path)
 
     def rollback_file(self, checkpoint_path: str, target_path: str) -> None:
         """Restore file from checkpoint"""
         if Path(checkpoint_path).exists():
+            # Target still linked to the checkpoint means it was never replaced
+            if Path(target_path).exists() and os.path.samefile(checkpoint_path, target_path):
+                return
             import shutil
             shutil.copy2(checkpoint_path, target_path)
 
@@ -237,6 +255,15 @@ class ContextManager:
         context.current_task = task
         self.write_context(context)
 
+    def _get_meta(self) -> Meta:
+        """Return cached meta, loading context only on first use"""
+        if self._meta_cache is None:
+            if self.context_path.exists():
+                self.load_context()
+            else:
+                self._meta_cache = Meta()
+        return self._meta_cache
+
     def _acquire_lock(self):
         """Simple file-based locking"""
         return FileLock(self.lock_path)
@@ -245,26 +272,26 @@ class ContextManager:
         """Write context to temp file then atomic rename"""
         temp_path = self.context_path.with_suffix('.tmp')
         with open(temp_path, 'w') as f:
-            json.dump(asdict(context), f, indent=2)
+            f.write(_JSON_ENCODER.encode(asdict(context)))
         temp_path.replace(self.context_path)
+        self._meta_cache = context.meta
 
     def _write_journal(self, journal: Journal) -> None:
         """Write journal to temp file then atomic rename"""
         temp_path = self.journal_path.with_suffix('.tmp')
         with open(temp_path, 'w') as f:
-            json.dump(asdict(journal), f, indent=2)
+            f.write(_JSON_ENCODER.encode(asdict(journal)))
         temp_path.replace(self.journal_path)
 
-    def _compact_journal(self, journal: Journal) -> None:
+    def _compact_journal(self, journal: Journal, meta: Meta) -> None:
         """Compact journal by summarizing old entries"""
-        context = self.load_context()
-        max_entries = context.meta.journal_max
+        max_entries = meta.journal_max
 
-        if len(journal.entries) <= context.meta.compact_after:
+        if len(journal.entries) <= meta.compact_after:
             return
 
         # Keep most recent entries
-        keep_count = min(max_entries, len(journal.entries) - context.meta.compact_after)
+        keep_count = min(max_entries, len(journal.entries) - meta.compact_after)
         recent_entries = journal.entries[-keep_count:]
 
         # Summarize old entries
@@ -2,13 +2,14 @@
 IRIS Agent Loop - Deterministic READ→PLAN→WRITE enforcement
 """
 import os
-import subprocess
+import shutil
+import sys
 import difflib
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from agent.iris_context import (
-    ContextManager, CurrentTask, Plan, IntendedEdit,
+    ContextManager, CurrentTask, Plan, IntendedEdit, Policy,
     FileRead, ReadState, calculate_checksum, create_task
 )
 from agent.task import Task, TaskStatus
@@ -16,6 +17,22 @@ from agent.memory import TaskRepository
 from agent.model_router import ModelRouter
 
 
+# Directories never scanned during the READ phase
+EXCLUDED_DIRS = frozenset({
+    '__pycache__', 'node_modules', 'venv', 'dist', 'build'
+})
+
+
+def _nth_newline(data: bytes, n: int) -> int:
+    """Offset of the n-th b'\\n' (1-based) in data; -1 for n == 0, len(data) if absent"""
+    pos = -1
+    for _ in range(n):
+        pos = data.find(b'\n', pos + 1)
+        if pos == -1:
+            return len(data)
+    return pos
+
+
 class IRISEnforcementError(Exception):
     """Raised when enforcement rules are violated"""
     pass
@@ -29,6 +46,7 @@ class AgentLoop:
         self.context_manager = ContextManager(str(self.project_root))
         self.task_repo = TaskRepository()
         self.model_router = ModelRouter()
+        self._rel_paths: Dict[str, str] = {}
 
     def execute_task(self, task_id: str) -> bool:
         """Execute task through READ→PLAN→WRITE enforcement"""
@@ -107,6 +125,7 @@ class AgentLoop:
 
         files_read = []
         for file_path in files_to_read:
+            file_path = sys.intern(file_path)
             if not Path(file_path).exists():
                 continue
 
@@ -127,7 +146,7 @@ class AgentLoop:
                 hash=hash_value
             ))
 
-            print(f"→ READ {Path(file_path).relative_to(self.project_root)} ({line_count} lines, hash: {hash_value[:8]}...)")
+            print(f"→ READ {self._relpath(file_path)} ({line_count} lines, hash: {hash_value[:8]}...)")
 
             # Update context
             context = self.context_manager.load_context()
@@ -184,7 +203,7 @@ Be very specific and actionable."""
 
         # Log edits
         for edit in intended_edits:
-            print(f"→ PLAN edit {Path(edit.file).relative_to(self.project_root)} lines {edit.range[0]}–{edit.range[1]} ({edit.reason})")
+            print(f"→ PLAN edit {self._relpath(edit.file)} lines {edit.range[0]}–{edit.range[1]} ({edit.reason})")
 
         # Log to journal
         self.context_manager.add_journal_entry({
@@ -198,19 +217,22 @@ Be very specific and actionable."""
 
     def _execute_write_phase(self, task: Task, plan: Plan) -> bool:
         """WRITE Phase: Apply changes with verification"""
+        # Snapshot read state once; edits in this phase never change it
+        context = self.context_manager.load_context()
+        files_read = context.current_task.read_state.files_read if context.current_task else {}
+
         for edit in plan.intended_edits:
-            print(f"IRIS ▸ WRITE ▸ Applying changes to {Path(edit.file).relative_to(self.project_root)}")
+            print(f"IRIS ▸ WRITE ▸ Applying changes to {self._relpath(edit.file)}")
 
             # Check enforcement: file must be in read_state
-            context = self.context_manager.load_context()
-            if not context.current_task or edit.file not in context.current_task.read_state.files_read:
+            if edit.file not in files_read:
                 raise IRISEnforcementError(f"MUST_READ_FIRST: File {edit.file} not in read state")
 
             # Generate the actual changes (simplified - in production, model generates this)
             edit.new_content = self._generate_edit_content(edit, task.goal)
 
             # Show diff preview
-            self._show_diff_preview(edit)
+            self._show_diff_preview(edit, context.policy)
 
             # Create checkpoint
             checkpoint_path = self.context_manager.create_checkpoint(task.id, edit.file)
@@ -218,7 +240,7 @@ Be very specific and actionable."""
             # Apply changes
             try:
                 self._apply_edit(edit)
-                print(f"→ WRITE applied changes to {Path(edit.file).relative_to(self.project_root)}")
+                print(f"→ WRITE applied changes to {self._relpath(edit.file)}")
 
                 # Verify changes
                 if not self._verify_changes(edit.file):
@@ -243,20 +265,49 @@ Be very specific and actionable."""
 
         return True
 
-    def _find_files_to_read(self) -> List[str]:
+    def _relpath(self, file_path: str) -> str:
+        """Project-relative display path, computed once per file"""
+        rel = self._rel_paths.get(file_path)
+        if rel is None:
+            try:
+                rel = str(Path(file_path).relative_to(self.project_root))
+            except ValueError:
+                # Already relative (planned edits) or outside the project
+                rel = file_path
+            self._rel_paths[file_path] = rel
+        return rel
+
+    def _find_files_to_read(self, limit: int = 10) -> List[str]:
         """Find files that should be read for analysis"""
         files = []
 
-        # Find Python files (simplified)
-        for root, dirs, filenames in os.walk(self.project_root):
-            # Skip hidden dirs and common excludes
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
+        # Find Python files (simplified), stopping once the limit is reached
+        for file_path in self._iter_python_files(str(self.project_root)):
+            files.append(file_path)
+            if len(files) >= limit:  # Limit for demo
+                break
+
+        return files
+
+    def _iter_python_files(self, directory: str):
+        """Yield .py files under directory using os.scandir, pruning excluded dirs"""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
 
-            for filename in filenames:
-                if filename.endswith('.py'):
-                    files.append(os.path.join(root, filename))
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Skip hidden dirs and common excludes
+                if not entry.name.startswith('.') and entry.name not in EXCLUDED_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield entry.path
 
-        return files[:10]  # Limit for demo
+        for subdir in subdirs:
+            yield from self._iter_python_files(subdir)
 
     def _parse_plan_response(self, response: str) -> List[IntendedEdit]:
         """Parse plan response into structured edits (simplified)"""
@@ -293,11 +344,11 @@ Be very specific and actionable."""
         # In production, this would use the model to generate specific code
         return f'# Modified for: {task_goal}\n# Lines {edit.range[0]}-{edit.range[1]}\n# {edit.reason}\n'
 
-    def _show_diff_preview(self, edit: IntendedEdit) -> None:
+    def _show_diff_preview(self, edit: IntendedEdit, policy: Policy) -> None:
         """Show before/after diff preview"""
         file_path = Path(edit.file)
 
-        print(f"IRIS ▸ WRITE ▸ preview changes for {file_path.relative_to(self.project_root)} lines {edit.range[0]}–{edit.range[1]}")
+        print(f"IRIS ▸ WRITE ▸ preview changes for {self._relpath(edit.file)} lines {edit.range[0]}–{edit.range[1]}")
 
         # Get original content
         if Path(edit.file).exists():
@@ -306,27 +357,34 @@ Be very specific and actionable."""
         else:
             original_content = ''
 
-        # Show diff
+        # Show diff, streaming colored lines as difflib yields them
         if original_content and edit.new_content:
-            diff = list(difflib.unified_diff(
-                original_content.splitlines(keepends=True),
-                edit.new_content.splitlines(keepends=True),
+            diff = difflib.unified_diff(
+                original_content.splitlines(),
+                edit.new_content.splitlines(),
                 fromfile=f'a/{file_path.name}',
                 tofile=f'b/{file_path.name}',
-                lineterm=''
-            ))
+                lineterm='',
+                n=3
+            )
+
+            write = sys.stdout.write
+            header_shown = False
+            for line in diff:
+                if not header_shown:
+                    write("----- DIFF -----\n")
+                    header_shown = True
+                if line.startswith('+'):
+                    write(f'\033[92m{line}\033[0m\n')  # Green
+                elif line.startswith('-'):
+                    write(f'\033[91m{line}\033[0m\n')  # Red
+                else:
+                    write(f'{line}\n')
+
+        if policy.trusted_workspace:
+            print("Task: Changes will be applied automatically (trusted workspace)")
+            return
 
-            if diff:
-                print("----- DIFF -----")
-                for line in diff:
-                    if line.startswith('+'):
-                        print(f'\033[92m{line}\033[0m')  # Green
-                    elif line.startswith('-'):
-                        print(f'\033[91m{line}\033[0m')  # Red
-                    else:
-                        print(line)
-
-        print("Task: Changes will be applied automatically (trusted workspace)")
         print("Press Enter to continue or Ctrl+C to cancel...")
         input()  # Wait for user
 
@@ -337,41 +395,50 @@ Be very specific and actionable."""
 
         file_path = Path(edit.file)
 
-        # Read current content
-        if file_path.exists():
-            with open(file_path, 'r') as f:
-                current_content = f.read()
-        else:
-            current_content = ''
-
-        lines = current_content.split('\n')
+        # Read current content as bytes; the range is spliced by offset
+        data = file_path.read_bytes() if file_path.exists() else b''
+        line_count = data.count(b'\n') + 1
 
         # Apply edit to specified range (simplified - replace entire range)
-        start_line = max(0, edit.range[0] - 1)  # Convert to 0-based
-        end_line = min(len(lines), edit.range[1])
-
-        new_lines = edit.new_content.split('\n')
-
-        # Replace the range
-        result_lines = lines[:start_line] + new_lines + lines[end_line:]
-
-        # Write back
-        with open(file_path, 'w') as f:
-            f.write('\n'.join(result_lines))
+        start_line = min(max(0, edit.range[0] - 1), line_count)  # Convert to 0-based
+        end_line = max(0, min(line_count, edit.range[1]))
+
+        parts = []
+        if start_line > 0:
+            parts.append(data[:_nth_newline(data, start_line)])
+        parts.append(edit.new_content.encode())
+        if end_line < line_count:
+            parts.append(data[_nth_newline(data, end_line) + 1:])
+
+        # Write to a temp file and swap it in, leaving the original inode
+        # (possibly hardlinked as a checkpoint) untouched
+        temp_path = file_path.with_name(file_path.name + '.iris.tmp')
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(b'\n'.join(parts))
+            if file_path.exists():
+                # Keep the original's mode bits (e.g. +x) and, where allowed, owner
+                shutil.copymode(file_path, temp_path)
+                st = file_path.stat()
+                try:
+                    os.chown(temp_path, st.st_uid, st.st_gid)
+                except (PermissionError, AttributeError):
+                    pass
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
     def _verify_changes(self, file_path: str) -> bool:
         """Verify that changes are syntactically correct"""
         if file_path.endswith('.py'):
+            # Syntax check in-process instead of spawning `python -m py_compile`
             try:
-                # Run Python syntax check
-                result = subprocess.run(
-                    ['python', '-m', 'py_compile', file_path],
-                    capture_output=True,
-                    text=True
-                )
-                return result.returncode == 0
-            except FileNotFoundError:
-                # Python not available, skip verification
+                with open(file_path, 'rb') as f:
+                    source = f.read()
+                compile(source, file_path, 'exec')
                 return True
+            except (SyntaxError, ValueError, OSError):
+                return False
 
         return True  # Default pass for other files
\ No newline at end of file
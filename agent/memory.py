@@ -61,12 +61,71 @@ class MemoryStore:
         return self._data.copy()
 
 
+class StepLog:
+    """Append-only JSONL sidecar holding each task's step history."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, task_id: int) -> Path:
+        return self.directory / f"{task_id}.steps.jsonl"
+
+    def append(self, task_id: int, steps: List[Dict[str, Any]]):
+        """Append steps, retrying until every byte is written."""
+        if not steps:
+            return
+        data = memoryview("".join(json.dumps(step) + "\n" for step in steps).encode("utf-8"))
+        fd = os.open(self._path(task_id), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # os.write may accept only part of the buffer
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def rewrite(self, task_id: int, steps: List[Dict[str, Any]]):
+        """Atomically replace a task's step log."""
+        path = self._path(task_id)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(step) + "\n" for step in steps))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(path)
+
+    def read(self, task_id: int) -> List[Dict[str, Any]]:
+        """Read a task's steps; a torn trailing line is ignored."""
+        steps = []
+        try:
+            with open(self._path(task_id), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        steps.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+        except FileNotFoundError:
+            pass
+        return steps
+
+    def remove(self, task_id: int):
+        """Delete a task's step log."""
+        try:
+            self._path(task_id).unlink()
+        except FileNotFoundError:
+            pass
+
+
 class TaskRepository:
     """Repository for task persistence and retrieval."""
 
     def __init__(self, filepath: str = "data/tasks.json"):
         self.store = MemoryStore(filepath)
+        self.step_log = StepLog(self.store.filepath.with_name(f"{self.store.filepath.stem}_steps"))
         self._tasks: Dict[int, Task] = {}
+        self._dict_cache: Dict[int, Dict[str, Any]] = {}
+        # Number of each task's steps already in its step log
+        self._persisted_steps: Dict[int, int] = {}
         self._next_id = 1
         self._load_tasks()
 
@@ -75,7 +134,17 @@ class TaskRepository:
         tasks_data = self.store.get("tasks", {})
         for task_id_str, task_data in tasks_data.items():
             try:
+                # Tasks saved before the step log keep their steps inline
+                # until their next update moves them over
+                inline_steps = task_data.get("steps")
                 task = Task.from_dict(task_data)
+                if inline_steps:
+                    self._persisted_steps[task.id] = 0
+                    self._dict_cache[task.id] = task.to_dict()
+                else:
+                    task.steps = self.step_log.read(task.id)
+                    self._persisted_steps[task.id] = len(task.steps)
+                    self._dict_cache[task.id] = task.to_dict(include_steps=False)
                 self._tasks[task.id] = task
             except (KeyError, TypeError):
                 continue
@@ -83,11 +152,25 @@ class TaskRepository:
         max_id = self.store.get("next_id", 1)
         self._next_id = max(1, max_id)
 
+    def _serialize(self, task: Task) -> Dict[str, Any]:
+        """Append unsaved steps to the step log and return the task's dict."""
+        persisted = self._persisted_steps.get(task.id, 0)
+        if len(task.steps) < persisted:
+            self.step_log.rewrite(task.id, task.steps)
+        else:
+            self.step_log.append(task.id, task.steps[persisted:])
+        self._persisted_steps[task.id] = len(task.steps)
+        return task.to_dict(include_steps=False)
+
     def _save_tasks(self):
-        """Persist all tasks to storage."""
+        """Persist all tasks to storage.
+
+        Only tasks touched via create/update are re-serialized; every other
+        entry reuses its cached dict from the last save.
+        """
         tasks_data = {
-            str(task_id): task.to_dict()
-            for task_id, task in self._tasks.items()
+            str(task_id): self._dict_cache[task_id]
+            for task_id in self._tasks
         }
         self.store.set("tasks", tasks_data)
         self.store.set("next_id", self._next_id)
@@ -105,6 +188,7 @@ class TaskRepository:
             updated_at=datetime.utcnow().isoformat()
         )
         self._tasks[task_id] = task
+        self._dict_cache[task_id] = self._serialize(task)
         self._save_tasks()
         return task
 
@@ -120,12 +204,16 @@ class TaskRepository:
         """Update existing task in storage."""
         if task.id in self._tasks:
             self._tasks[task.id] = task
+            self._dict_cache[task.id] = self._serialize(task)
             self._save_tasks()
 
     def delete(self, task_id: int) -> bool:
         """Delete task by ID, return True if deleted."""
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._dict_cache.pop(task_id, None)
+            self._persisted_steps.pop(task_id, None)
             self._save_tasks()
+            self.step_log.remove(task_id)
             return True
         return False
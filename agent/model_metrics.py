@@ -1,40 +1,271 @@
 """Model metrics tracking for cost, latency, and health."""
+import os
+import re
 import time
 import json
+import atexit
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from .model_metrics_wal import MetricsWAL, encode_record
+from ._json import dumps, loads
+
+
+# Number of recent requests averaged into avg_latency_ms
+LATENCY_WINDOW = 256
+
+
+@dataclass(slots=True)
+class ProviderMetrics:
+    """Usage counters and rate-limit state for one provider."""
+
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    total_prompt_tokens: int = 0
+    total_completion_tokens: int = 0
+    avg_latency_ms: float = 0.0
+    last_request_at: Optional[float] = None
+    rate_limit_hit: bool = False
+    cooldown_until: Optional[float] = None
+
+    # Rolling latency window and its running sum; neither is persisted, the
+    # window refills from new requests after a restart
+    recent_latencies_ms: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    latency_sum: float = 0.0
+
+    def record(
+                self,
+                prompt_tokens: int,
+                completion_tokens: int,
+                latency_ms: float,
+                success: bool,
+                timestamp: float
+    ):
+        """Apply one generation event."""
+        self.total_requests += 1
+        if success:
+                self.successful_requests += 1
+        else:
+                self.failed_requests += 1
+
+        self.total_prompt_tokens += prompt_tokens
+        self.total_completion_tokens += completion_tokens
+
+        # Rolling average over the last LATENCY_WINDOW requests
+        window = self.recent_latencies_ms
+        if len(window) == window.maxlen:
+                self.latency_sum -= window[0]
+        window.append(latency_ms)
+        self.latency_sum += latency_ms
+        self.avg_latency_ms = self.latency_sum / len(window)
+
+        self.last_request_at = timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON snapshot representation."""
+        return {
+                "total_requests": self.total_requests,
+                "successful_requests": self.successful_requests,
+                "failed_requests": self.failed_requests,
+                "total_prompt_tokens": self.total_prompt_tokens,
+                "total_completion_tokens": self.total_completion_tokens,
+                "avg_latency_ms": self.avg_latency_ms,
+                "last_request_at": self.last_request_at,
+                "rate_limit_hit": self.rate_limit_hit,
+                "cooldown_until": self.cooldown_until
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProviderMetrics":
+        """Create from a snapshot record; unknown keys (e.g. total_latency_ms) are ignored."""
+        return cls(
+                total_requests=data.get("total_requests", 0),
+                successful_requests=data.get("successful_requests", 0),
+                failed_requests=data.get("failed_requests", 0),
+                total_prompt_tokens=data.get("total_prompt_tokens", 0),
+                total_completion_tokens=data.get("total_completion_tokens", 0),
+                avg_latency_ms=data.get("avg_latency_ms", 0.0),
+                last_request_at=data.get("last_request_at"),
+                rate_limit_hit=data.get("rate_limit_hit", False),
+                cooldown_until=data.get("cooldown_until")
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderHealth:
+    """Point-in-time health summary for one provider."""
+
+    provider: str
+    available: bool = True
+    health_score: float = 1.0
+    total_requests: int = 0
+    success_rate: float = 0.0
+    avg_latency_ms: float = 0.0
+    rate_limited: bool = False
+    in_cooldown: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert health summary to dictionary."""
+        return {
+                "provider": self.provider,
+                "available": self.available,
+                "health_score": self.health_score,
+                "total_requests": self.total_requests,
+                "success_rate": self.success_rate,
+                "avg_latency_ms": self.avg_latency_ms,
+                "rate_limited": self.rate_limited,
+                "in_cooldown": self.in_cooldown
+        }
 
 
 class ModelMetrics:
     """Track model usage metrics."""
 
-    def __init__(self, metrics_path: str = "data/model_metrics.json"):
+    # Upper bound on memoized provider health results
+    HEALTH_CACHE_SIZE = 64
+
+    # Header values that signal rate limiting
+    _RATE_LIMIT_RE = re.compile(r"429|rate[\s_]*limit|quota|limit", re.IGNORECASE)
+
+    def __init__(
+                self,
+                metrics_path: str = "data/model_metrics.json",
+                flush_interval: float = 0.25,
+                max_pending: int = 100,
+                compact_every: int = 10000
+    ):
         self.metrics_path = Path(metrics_path)
         self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
-        self._metrics: Dict[str, Dict[str, Any]] = {}
+        self._metrics: Dict[str, ProviderMetrics] = {}
+        # provider -> bound ProviderMetrics.record, resolved once per provider
+        self._recorders: Dict[str, Callable[..., None]] = {}
+
+        # Write batching: updates mark the store dirty and are flushed
+        # after flush_interval seconds or max_pending updates
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Generation events are appended to a binary log between snapshots;
+        # the JSON snapshot is only rewritten every compact_every records
+        # or when non-counter state (rate limits) changes
+        self.compact_every = compact_every
+        self._wal = MetricsWAL(str(self.metrics_path.with_suffix(".wal")))
+        self._wal_buffer: List[bytes] = []
+        self._snapshot_due = False
+        # Hash of the last snapshot written; identical payloads are not rewritten
+        self._last_payload_hash: Optional[int] = None
+
+        # Bumped on every recorded event; lets callers cache derived health views
+        self.generation = 0
+
+        # provider -> ((total_requests, cooldown_until, in_cooldown), health)
+        self._health_cache: Dict[str, Tuple[Tuple[int, Optional[float], bool], ProviderHealth]] = {}
+
         self._load()
+        atexit.register(self.flush)
 
     def _load(self):
         """Load metrics from disk."""
+        covered_generation = -1
         if self.metrics_path.exists():
                 try:
-                        with open(self.metrics_path, "r", encoding="utf-8") as f:
-                                self._metrics = json.load(f)
+                        with open(self.metrics_path, "rb") as f:
+                                data = loads(f.read())
+                        if "providers" in data and "wal_generation" in data:
+                                covered_generation = data["wal_generation"]
+                                data = data["providers"]
+                        self._metrics = {
+                                provider: ProviderMetrics.from_dict(record)
+                                for provider, record in data.items()
+                        }
                 except (json.JSONDecodeError, IOError):
                         self._metrics = {}
 
+        # Replay events logged since the last snapshot
+        replay = self._wal.replay(covered_generation)
+        for provider, prompt_tokens, completion_tokens, latency_ms, timestamp, success in replay:
+                self._record_generation(provider, prompt_tokens, completion_tokens, latency_ms, success, timestamp)
+
     def _save(self):
         """Atomically save metrics to disk."""
+        data = {provider: metrics.to_dict() for provider, metrics in self._metrics.items()}
+        providers_payload = dumps(data)
+        payload_hash = hash(providers_payload)
+        if payload_hash == self._last_payload_hash:
+                # Unchanged since the last snapshot, so the log holds no newer events
+                return
+
+        # The snapshot records the log generation it covers; replay skips it
+        payload = b'{"wal_generation":%d,"providers":%s}' % (self._wal.generation, providers_payload)
+
         temp_path = self.metrics_path.with_suffix(".tmp")
         try:
-                with open(temp_path, "w", encoding="utf-8") as f:
-                        json.dump(self._metrics, f, indent=2)
-                temp_path.replace(self.metrics_path)
+                with open(temp_path, "wb") as f:
+                        # Buffered write() retries short writes until all bytes are out
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(temp_path, self.metrics_path)
+                self._fsync_dir()
+                self._last_payload_hash = payload_hash
         except (IOError, OSError):
                 if temp_path.exists():
                         temp_path.unlink()
                 raise
 
+    def _fsync_dir(self):
+        """Persist the rename of the snapshot file."""
+        if not hasattr(os, "O_DIRECTORY"):
+                return
+        dir_fd = os.open(self.metrics_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+                os.fsync(dir_fd)
+        finally:
+                os.close(dir_fd)
+
+    def _mark_dirty(self):
+        """Schedule a save, flushing immediately once max_pending is reached."""
+        with self._lock:
+                self._pending += 1
+                if self._pending >= self.max_pending:
+                        self.flush()
+                elif self._flush_timer is None:
+                        self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+
+    def flush(self):
+        """Write pending metric updates to disk."""
+        with self._lock:
+                if self._flush_timer is not None:
+                        self._flush_timer.cancel()
+                        self._flush_timer = None
+                if not self._pending:
+                        return
+                self._pending = 0
+
+                if self._snapshot_due or self._wal.record_count + len(self._wal_buffer) >= self.compact_every:
+                        # Snapshot covers every buffered event, so the log restarts empty
+                        self._save()
+                        self._wal.reset()
+                        self._snapshot_due = False
+                else:
+                        self._wal.append(self._wal_buffer)
+                self._wal_buffer = []
+
+    def close(self):
+        """Flush pending updates and release the log file."""
+        self.flush()
+        atexit.unregister(self.flush)
+        with self._lock:
+                self._wal.close()
+
     def record_generation(
                 self,
                 provider: str,
@@ -43,107 +274,115 @@ class ModelMetrics:
                 latency_ms: float,
                 success: bool = True
     ):
-        """Record a model generation event."""
-        if provider not in self._metrics:
-                self._metrics[provider] = {
-                        "total_requests": 0,
-                        "successful_requests": 0,
-                        "failed_requests": 0,
-                        "total_prompt_tokens": 0,
-                        "total_completion_tokens": 0,
-                        "total_latency_ms": 0.0,
-                        "avg_latency_ms": 0.0,
-                        "last_request_at": None,
-                        "rate_limit_hit": False,
-                        "cooldown_until": None
-                }
+        """Record a model generation event.
 
-        metrics = self._metrics[provider]
+        Safe to call from multiple threads: the timestamp and WAL record are
+        prepared before taking the lock, which only guards the counter
+        update and the append to the pending batch.
+        """
+        timestamp = time.time()
+        record = encode_record(provider, prompt_tokens, completion_tokens, latency_ms, timestamp, success)
+        with self._lock:
+                self._record_generation(provider, prompt_tokens, completion_tokens, latency_ms, success, timestamp)
+                self._health_cache.pop(provider, None)
+                self.generation += 1
+                self._wal_buffer.append(record)
+                self._mark_dirty()
 
-        # Update counters
-        metrics["total_requests"] += 1
-        if success:
-                metrics["successful_requests"] += 1
-        else:
-                metrics["failed_requests"] += 1
-
-        metrics["total_prompt_tokens"] += prompt_tokens
-        metrics["total_completion_tokens"] += completion_tokens
-
-        # Calculate rolling average latency
-        total_latency = metrics["total_latency_ms"] + latency_ms
-        metrics["total_latency_ms"] = total_latency
-        metrics["avg_latency_ms"] = total_latency / metrics["total_requests"]
-
-        metrics["last_request_at"] = time.time()
+    def _record_generation(
+                self,
+                provider: str,
+                prompt_tokens: int,
+                completion_tokens: int,
+                latency_ms: float,
+                success: bool,
+                timestamp: float
+    ):
+        """Apply a generation event to the in-memory metrics."""
+        recorder = self._recorders.get(provider)
+        if recorder is None:
+                recorder = self._recorders[provider] = self._ensure_provider(provider).record
+        recorder(prompt_tokens, completion_tokens, latency_ms, success, timestamp)
 
-        self._metrics[provider] = metrics
-        self._save()
+    def _ensure_provider(self, provider: str) -> ProviderMetrics:
+        """Get or create the metrics object for a provider."""
+        metrics = self._metrics.get(provider)
+        if metrics is None:
+                metrics = self._metrics[provider] = ProviderMetrics()
+        return metrics
 
     def check_rate_limit(self, provider: str, response_headers: Dict[str, str]) -> bool:
         """Check if response indicates rate limiting."""
-        rate_limit_indicators = [
-                "429",
-                "rate_limit",
-                "rate limit",
-                "quota",
-                "limit"
-        ]
-
-        for key, value in response_headers.items():
-                if any(indicator in value.lower() for indicator in rate_limit_indicators):
-                        self._metrics[provider]["rate_limit_hit"] = True
-
-                        # Set cooldown: 2 minutes
-                        self._metrics[provider]["cooldown_until"] = time.time() + 120
-                        self._save()
+        search = self._RATE_LIMIT_RE.search
+
+        for value in response_headers.values():
+                if search(value):
+                        with self._lock:
+                                metrics = self._ensure_provider(provider)
+                                metrics.rate_limit_hit = True
+
+                                # Set cooldown: 2 minutes
+                                metrics.cooldown_until = time.time() + 120
+                                self._snapshot_due = True
+                                self._health_cache.pop(provider, None)
+                                self.generation += 1
+                                self._mark_dirty()
                         return True
 
         return False
 
-    def get_provider_health(self, provider: str) -> Dict[str, Any]:
+    def get_provider_health(self, provider: str) -> ProviderHealth:
         """Get health score for provider."""
         if provider not in self._metrics:
-                return {
-                        "provider": provider,
-                        "available": True,
-                        "health_score": 1.0,
-                        "total_requests": 0
-                }
+                return ProviderHealth(provider)
 
         metrics = self._metrics[provider]
 
+        # Reuse the last result while counters and cooldown state are unchanged
+        cooldown_until = metrics.cooldown_until
+        in_cooldown = time.time() < cooldown_until if cooldown_until else False
+        cache_key = (metrics.total_requests, cooldown_until, in_cooldown)
+        cached = self._health_cache.get(provider)
+        if cached is not None and cached[0] == cache_key:
+                return cached[1]
+
         # Calculate health score (0-1)
-        success_rate = metrics["successful_requests"] / max(metrics["total_requests"], 1)
+        success_rate = metrics.successful_requests / max(metrics.total_requests, 1)
 
         # Penalize for failures
-        if metrics["rate_limit_hit"]:
+        if metrics.rate_limit_hit:
                 score = max(0.1, success_rate) * 0.5
-        elif metrics["failed_requests"] / metrics["total_requests"] > 0.2:
+        elif metrics.failed_requests / metrics.total_requests > 0.2:
                 score = max(0.1, success_rate * 0.7)
         else:
                 score = success_rate
 
         # Check if in cooldown
-        if metrics.get("cooldown_until", 0) and time.time() < metrics["cooldown_until"]:
+        if in_cooldown:
                 score *= 0.5
 
         # Check latency penalty
-        if metrics["avg_latency_ms"] > 5000:
+        if metrics.avg_latency_ms > 5000:
                 score *= 0.8
 
-        return {
-                "provider": provider,
-                "available": score > 0.5,
-                "health_score": score,
-                "total_requests": metrics["total_requests"],
-                "success_rate": success_rate,
-                "avg_latency_ms": metrics["avg_latency_ms"],
-                "rate_limited": metrics["rate_limit_hit"],
-                "in_cooldown": time.time() < metrics.get("cooldown_until", 0) if metrics.get("cooldown_until") else False
-        }
+        health = ProviderHealth(
+                provider,
+                score > 0.5,
+                score,
+                metrics.total_requests,
+                success_rate,
+                metrics.avg_latency_ms,
+                metrics.rate_limit_hit,
+                in_cooldown
+        )
+
+        if provider not in self._health_cache and len(self._health_cache) >= self.HEALTH_CACHE_SIZE:
+                # Evict the oldest entry
+                self._health_cache.pop(next(iter(self._health_cache)))
+        self._health_cache[provider] = (cache_key, health)
+        return health
 
     def is_provider_available(self, provider: str) -> bool:
         """Check if provider is available for use."""
         health = self.get_provider_health(provider)
-        return health["available"] and not health["in_cooldown"]
+        return health.available and not health.in_cooldown
@@ -0,0 +1,133 @@
+"""Append-only binary log of model generation events."""
+import os
+import struct
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# prompt_tokens, completion_tokens, latency_ms, timestamp, success, provider length
+_RECORD = struct.Struct("<IIdd?H")
+
+# File header: magic, generation number. The snapshot stores the last
+# generation it covers, so a log left behind by a crash is not replayed twice.
+_MAGIC = b"MWAL"
+_HEADER = struct.Struct("<4sQ")
+
+GenerationRecord = Tuple[str, int, int, float, float, bool]
+
+
+def _write_all(fd: int, data: bytes):
+        """Write every byte of data; os.write may accept only part of it."""
+        view = memoryview(data)
+        while view:
+                view = view[os.write(fd, view):]
+
+
+def encode_record(
+        provider: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_ms: float,
+        timestamp: float,
+        success: bool
+) -> bytes:
+        """Encode one generation event as a fixed header plus provider name."""
+        name = provider.encode("utf-8")
+        return _RECORD.pack(
+                prompt_tokens,
+                completion_tokens,
+                latency_ms,
+                timestamp,
+                success,
+                len(name)
+        ) + name
+
+
+class MetricsWAL:
+    """Length-prefixed record log appended between metrics snapshots."""
+
+    def __init__(self, wal_path: str):
+        self.wal_path = Path(wal_path)
+        self._fd: Optional[int] = None
+        self.record_count = 0
+        # Generation of the records currently in the log
+        self.generation = 0
+
+    def _open(self) -> int:
+        """Open the log for appending on first use."""
+        if self._fd is None:
+                self._fd = os.open(
+                        self.wal_path,
+                        os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                        0o644
+                )
+                if os.fstat(self._fd).st_size == 0:
+                        self._write_header()
+        return self._fd
+
+    def _write_header(self):
+        """Start an empty log with the current generation."""
+        _write_all(self._fd, _HEADER.pack(_MAGIC, self.generation))
+
+    def append(self, records: List[bytes]):
+        """Append a batch of encoded records with a single write."""
+        if not records:
+                return
+        _write_all(self._open(), b"".join(records))
+        self.record_count += len(records)
+
+    def replay(self, covered_generation: int = -1) -> Iterator[GenerationRecord]:
+        """Yield logged events newer than covered_generation.
+
+        A truncated trailing record is ignored. A log whose generation is
+        already covered by the snapshot is discarded instead of replayed.
+        """
+        self.record_count = 0
+        self.generation = covered_generation + 1
+        if not self.wal_path.exists():
+                return
+
+        with open(self.wal_path, "rb") as f:
+                data = f.read()
+
+        offset = 0
+        if data[:len(_MAGIC)] == _MAGIC:
+                if len(data) < _HEADER.size:
+                        self.reset()
+                        return
+                _, generation = _HEADER.unpack_from(data)
+                if generation <= covered_generation:
+                        # Snapshot was written but the log not yet reset
+                        self.reset()
+                        return
+                self.generation = generation
+                offset = _HEADER.size
+
+        header_size = _RECORD.size
+        while offset + header_size <= len(data):
+                (prompt_tokens, completion_tokens, latency_ms,
+                 timestamp, success, name_len) = _RECORD.unpack_from(data, offset)
+                end = offset + header_size + name_len
+                if end > len(data):
+                        break
+                provider = data[offset + header_size:end].decode("utf-8")
+                offset = end
+                self.record_count += 1
+                yield provider, prompt_tokens, completion_tokens, latency_ms, timestamp, success
+
+        if offset < len(data):
+                # Drop a torn trailing record so later appends stay aligned
+                os.truncate(self.wal_path, offset)
+
+    def reset(self):
+        """Discard logged records once they are covered by a snapshot."""
+        fd = self._open()
+        os.ftruncate(fd, 0)
+        self.generation += 1
+        self._write_header()
+        self.record_count = 0
+
+    def close(self):
+        """Close the log file descriptor."""
+        if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
@@ -1,9 +1,29 @@
 """Model provider router for selecting and using providers."""
+import functools
 import os
-from typing import Dict, Any, Optional, Iterator
+from typing import Dict, Any, Optional, Iterator, Callable
 from .models import ModelProvider
 from .providers.dummy import DummyProvider
-from .providers.openai_provider import OpenAIProvider
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap whitespace token estimate without building a list of words."""
+    return text.count(" ") + 1 if text else 0
+
+
+def _openai_provider() -> ModelProvider:
+    """Build the OpenAI provider, deferring its (SDK) import to first use."""
+    from .providers.openai_provider import OpenAIProvider
+    return OpenAIProvider()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_factories() -> Dict[str, Callable[[], ModelProvider]]:
+    """Built-in provider factories, assembled once per process."""
+    return {
+        "dummy": DummyProvider,
+        "openai": _openai_provider
+    }
 
 
 class ModelRouter:
@@ -16,6 +36,11 @@ class ModelRouter:
         account_rotator=None
     ):
         self._providers: Dict[str, ModelProvider] = {}
+        # Built-in providers are constructed on first use; copy the shared
+        # registry so per-router registrations stay local
+        self._factories: Dict[str, Callable[[], ModelProvider]] = dict(_default_factories())
+        # Streaming capability captured once at registration
+        self._supports_streaming: Dict[str, bool] = {}
         self._default_provider: Optional[str] = None
 
         # Integrated systems
@@ -23,10 +48,6 @@ class ModelRouter:
         self.router_policy = router_policy
         self.account_rotator = account_rotator
 
-        # Auto-register built-in providers
-        self.register("dummy", DummyProvider())
-        self.register("openai", OpenAIProvider())
-
         # Set default: OpenAI if API key present, else dummy
         if os.getenv("OPENAI_API_KEY"):
             self._default_provider = "openai"
@@ -35,14 +56,33 @@ class ModelRouter:
 
     def register(self, name: str, provider: ModelProvider):
         """Register a provider instance."""
+        self._factories.pop(name, None)
         self._providers[name] = provider
+        self._supports_streaming[name] = bool(provider.supports_streaming)
+
+    def register_factory(self, name: str, factory: Callable[[], ModelProvider]):
+        """Register a provider to be constructed lazily on first use."""
+        if name not in self._providers:
+            self._factories[name] = factory
+
+    def _instantiate(self, name: str) -> ModelProvider:
+        """Return the provider instance for a resolved name, building it if needed."""
+        provider = self._providers.get(name)
+        if provider is None:
+            provider = self._factories[name]()
+            self.register(name, provider)
+        return provider
+
+    def _resolve_provider_name(self, name: Optional[str] = None) -> str:
+        """Resolve requested name to a registered provider, or default if none specified."""
+        provider_name = name or self._default_provider
+        if not provider_name or (provider_name not in self._providers and provider_name not in self._factories):
+            return "dummy"  # Fallback
+        return provider_name
 
     def get_provider(self, name: Optional[str] = None) -> ModelProvider:
         """Get provider by name, or default if none specified."""
-        provider_name = name or self._default_provider
-        if not provider_name or provider_name not in self._providers:
-            return self._providers["dummy"]  # Fallback
-        return self._providers[provider_name]
+        return self._instantiate(self._resolve_provider_name(name))
 
     def generate(
         self,
@@ -86,8 +126,8 @@ class ModelRouter:
                     account_id=account_id,
                     success=True,
                     latency_ms=latency,
-                    tokens_in=len(prompt.split()),
-                    tokens_out=len(response.split())
+                    tokens_in=_estimate_tokens(prompt),
+                    tokens_out=_estimate_tokens(response)
                 )
 
             return response
@@ -114,18 +154,19 @@ class ModelRouter:
         provider_name: Optional[str] = None
     ) -> Iterator[str]:
         """Generate streaming response if supported, else fallback."""
-        provider = self.get_provider(provider_name)
+        name = self._resolve_provider_name(provider_name)
+        provider = self._instantiate(name)
 
-        if provider.supports_streaming:
-                return provider.generate_stream(prompt, context)
+        if self._supports_streaming[name]:
+                yield from provider.generate_stream(prompt, context)
+                return
 
         # Fallback: yield full response as single chunk
-        response = provider.generate(prompt, context)
-        yield response
+        yield provider.generate(prompt, context)
 
     def list_providers(self) -> list[str]:
         """List all registered provider names."""
-        return list(self._providers.keys())
+        return list(dict.fromkeys([*self._providers, *self._factories]))
 
     def get_default_provider(self) -> Optional[str]:
         """Get name of default provider."""
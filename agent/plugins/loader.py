@@ -3,9 +3,18 @@ import os
 import sys
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from .manifest import PluginManifest
 
+# Shared empty result for plugins without tools/skills/models
+EMPTY_TUPLE: Tuple = ()
+
+
+def _yaml_safe_loader():
+        """Return libyaml's CSafeLoader when available, else the pure-Python SafeLoader."""
+        import yaml
+        return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PluginLoader:
     """Load and manage plugins."""
@@ -14,6 +23,14 @@ class PluginLoader:
         self.plugins_dir = Path(plugins_dir)
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
         self._loaded_plugins: Dict[str, PluginManifest] = {}
+        # plugin name -> tools/skills/models, kept in step with _loaded_plugins
+        self._tools_index: Dict[str, Sequence[Dict[str, Any]]] = {}
+        self._skills_index: Dict[str, Sequence[Dict[str, Any]]] = {}
+        self._models_index: Dict[str, Sequence[Dict[str, Any]]] = {}
+        # Bumped whenever the loaded set changes; lets callers cache derived views
+        self.generation = 0
+        # manifest path -> (mtime_ns, parsed manifest); skips YAML for unchanged files
+        self._manifest_cache: Dict[Path, Tuple[int, PluginManifest]] = {}
         self._load_all()
 
     def _load_all(self):
@@ -27,18 +44,43 @@ class PluginLoader:
                         try:
                                 manifest = self._load_manifest(manifest_path)
                                 if manifest:
-                                        self._loaded_plugins[manifest.name] = manifest
+                                        self._add_plugin(manifest.name, manifest)
                         except Exception as e:
                                 print(f"Failed to load plugin from {plugin_path}: {e}")
 
+    def _add_plugin(self, name: str, manifest: PluginManifest):
+        """Register a loaded manifest and index its contents."""
+        self._loaded_plugins[name] = manifest
+        self._tools_index[name] = manifest.tools or EMPTY_TUPLE
+        self._skills_index[name] = manifest.skills or EMPTY_TUPLE
+        self._models_index[name] = manifest.models or EMPTY_TUPLE
+        self.generation += 1
+
+    def _drop_plugin(self, name: str) -> bool:
+        """Forget a loaded manifest and its index entries."""
+        if self._loaded_plugins.pop(name, None) is None:
+                return False
+        self._tools_index.pop(name, None)
+        self._skills_index.pop(name, None)
+        self._models_index.pop(name, None)
+        self.generation += 1
+        return True
+
     def _load_manifest(self, manifest_path: Path) -> Optional[PluginManifest]:
         """Load plugin manifest."""
         import yaml
 
         try:
+                mtime_ns = manifest_path.stat().st_mtime_ns
+                cached = self._manifest_cache.get(manifest_path)
+                if cached is not None and cached[0] == mtime_ns:
+                        return cached[1]
+
                 with open(manifest_path, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                return PluginManifest.from_dict(data)
+                        data = yaml.load(f, Loader=_yaml_safe_loader())
+                manifest = PluginManifest.from_dict(data)
+                self._manifest_cache[manifest_path] = (mtime_ns, manifest)
+                return manifest
         except Exception:
                 return None
 
@@ -50,12 +92,21 @@ class PluginLoader:
         """List all loaded plugins."""
         return list(self._loaded_plugins.values())
 
+    def tools_for(self, name: str) -> Sequence[Dict[str, Any]]:
+        """Tools declared by a loaded plugin."""
+        return self._tools_index.get(name, EMPTY_TUPLE)
+
+    def skills_for(self, name: str) -> Sequence[Dict[str, Any]]:
+        """Skills declared by a loaded plugin."""
+        return self._skills_index.get(name, EMPTY_TUPLE)
+
+    def models_for(self, name: str) -> Sequence[Dict[str, Any]]:
+        """Models declared by a loaded plugin."""
+        return self._models_index.get(name, EMPTY_TUPLE)
+
     def unload_plugin(self, name: str) -> bool:
         """Unload a plugin."""
-        if name in self._loaded_plugins:
-                del self._loaded_plugins[name]
-                return True
-        return False
+        return self._drop_plugin(name)
 
     def reload_plugin(self, name: str) -> bool:
         """Reload a plugin."""
@@ -76,7 +127,7 @@ class PluginLoader:
                 manifest = self._load_manifest(plugin_path / "manifest.yaml")
 
                 if manifest:
-                        self._loaded_plugins[name] = manifest
+                        self._add_plugin(name, manifest)
                         return True
 
         return False
@@ -84,6 +135,10 @@ class PluginLoader:
     def _unload_all(self):
         """Unload all plugins."""
         self._loaded_plugins = {}
+        self._tools_index = {}
+        self._skills_index = {}
+        self._models_index = {}
+        self.generation += 1
 
     def install_plugin(self, plugin_path: str) -> bool:
         """Install plugin from path or URL."""
@@ -102,37 +157,42 @@ class PluginLoader:
 
         dest_path = self.plugins_dir / path.parent.name
 
-        if dest_path.exists():
-                return False
-
         import shutil
         try:
                 if path.is_file():
-                        shutil.copy2(path, dest_path)
+                        # Exclusive create so an existing install is never overwritten
+                        with open(path, "rb") as src, open(dest_path, "xb") as dst:
+                                shutil.copyfileobj(src, dst)
+                        shutil.copystat(path, dest_path)
                 else:
-                        shutil.copytree(path, dest_path, dirs_exist_ok=True)
-
-                print(f"Plugin installed: {dest_path.name}")
-                self._load_all()
-                return True
+                        shutil.copytree(path, dest_path, dirs_exist_ok=False)
+        except FileExistsError:
+                return False
         except Exception as e:
                 print(f"Failed to install plugin: {e}")
                 return False
 
+        print(f"Plugin installed: {dest_path.name}")
+
+        # Index only the new plugin instead of rescanning every manifest
+        manifest = self._load_manifest(dest_path / "manifest.yaml")
+        if manifest:
+                self._add_plugin(manifest.name, manifest)
+        return True
+
     def remove_plugin(self, name: str) -> bool:
         """Remove installed plugin."""
         plugin_dir = self.plugins_dir / name
 
-        if not plugin_dir.exists():
-                return False
-
         import shutil
         try:
                 shutil.rmtree(plugin_dir)
-                if name in self._loaded_plugins:
-                        del self._loaded_plugins[name]
-                print(f"Plugin removed: {name}")
-                return True
+        except FileNotFoundError:
+                return False
         except Exception as e:
                 print(f"Failed to remove plugin: {e}")
                 return False
+
+        self._drop_plugin(name)
+        print(f"Plugin removed: {name}")
+        return True
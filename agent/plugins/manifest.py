@@ -1,5 +1,6 @@
 """Plugin manifest representation."""
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 
 
@@ -17,6 +18,11 @@ class PluginManifest:
     permissions: List[str]
     min_core_version: str = "1.0.0"
 
+    @cached_property
+    def permissions_set(self) -> frozenset:
+        """Granted permissions as a frozenset for O(1) membership checks."""
+        return frozenset(self.permissions)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert manifest to dictionary."""
         return {
@@ -1,99 +1,103 @@
 """Plugin registry and interface."""
-from typing import Dict, Any, List, Optional, Callable
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple
 from .loader import PluginLoader
 from .manifest import PluginManifest
 from ..tools.registry import ToolRegistry
 
 
+@lru_cache(maxsize=256)
+def _parse_version(value: str):
+        """Parse a version string once per distinct value."""
+        try:
+                from packaging.version import Version
+        except ImportError:
+                # packaging is optional; compare dotted numeric parts, so "1.0" == "1.0.0"
+                parts = [int(part) if part.isdigit() else 0 for part in value.split(".")]
+                while parts and parts[-1] == 0:
+                        parts.pop()
+                return tuple(parts)
+        return Version(value)
+
+
 class PluginRegistry:
     """Central registry for all plugins."""
 
+    HOOK_EVENTS = (
+            "before_task",
+            "after_task",
+            "before_tool",
+            "after_tool",
+            "before_model",
+            "after_model"
+    )
+
     def __init__(self, tool_registry: ToolRegistry):
         self.tool_registry = tool_registry
         self.loader = PluginLoader()
-        self._hooks: Dict[str, List[Callable]] = {}
+        self._hooks: Dict[str, Tuple[Callable, ...]] = {}
+        # attr -> (loader generation, items collected across all plugins)
+        self._collected: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
         self._initialize()
 
     def _initialize(self):
         """Initialize hooks system."""
-        self._hooks = {
-                "before_task": [],
-                "after_task": [],
-                "before_tool": [],
-                "after_tool": [],
-                "before_model": [],
-                "after_model": []
-        }
+        self._hooks = {event: () for event in self.HOOK_EVENTS}
 
     def register_hook(self, event: str, callback: Callable):
         """Register a callback for specific event."""
-        if event not in self._hooks:
-                self._hooks[event] = []
-
-        self._hooks[event].append(callback)
+        # Callbacks are stored as tuples; registration is rare, dispatch is hot
+        self._hooks[event] = self._hooks.get(event, ()) + (callback,)
 
     def trigger_hooks(self, event: str, context: Dict[str, Any]):
         """Trigger all hooks for an event."""
-        if event in self._hooks:
-                for callback in self._hooks[event]:
-                        try:
-                                callback(context)
-                        except Exception as e:
-                                print(f"Hook error in {event}: {e}")
-
-    def get_plugin_tools(self, plugin_name: str) -> List[Dict[str, Any]]:
-        """Get all tools from a plugin."""
-        plugin = self.loader.load_plugin(plugin_name)
+        callbacks = self._hooks.get(event)
+        if not callbacks:
+                return
 
-        if not plugin:
-                return []
+        for callback in callbacks:
+                try:
+                        callback(context)
+                except Exception as e:
+                        print(f"Hook error in {event}: {e}")
 
-        return plugin.tools if plugin.tools else []
+    def get_plugin_tools(self, plugin_name: str) -> Sequence[Dict[str, Any]]:
+        """Get all tools from a plugin."""
+        return self.loader.tools_for(plugin_name)
 
-    def get_plugin_skills(self, plugin_name: str) -> List[Dict[str, Any]]:
+    def get_plugin_skills(self, plugin_name: str) -> Sequence[Dict[str, Any]]:
         """Get all skills from a plugin."""
-        plugin = self.loader.load_plugin(plugin_name)
-
-        if not plugin:
-                return []
-
-        return plugin.skills if plugin.skills else []
+        return self.loader.skills_for(plugin_name)
 
-    def get_plugin_models(self, plugin_name: str) -> List[Dict[str, Any]]:
+    def get_plugin_models(self, plugin_name: str) -> Sequence[Dict[str, Any]]:
         """Get all models from a plugin."""
-        plugin = self.loader.load_plugin(plugin_name)
-
-        if not plugin:
-                return []
-
-        return plugin.models if plugin.models else []
+        return self.loader.models_for(plugin_name)
+
+    def _collect(self, attr: str) -> List[Dict[str, Any]]:
+        """Gather one manifest attribute across all loaded plugins in a single pass."""
+        generation = self.loader.generation
+        cached = self._collected.get(attr)
+        if cached is None or cached[0] != generation:
+                items = [
+                        item
+                        for manifest in self.loader.list_plugins()
+                        for item in getattr(manifest, attr, None) or []
+                ]
+                cached = (generation, items)
+                self._collected[attr] = cached
+        return list(cached[1])
 
     def get_all_tools(self) -> List[Dict[str, Any]]:
         """Get all tools from all loaded plugins."""
-        all_tools = []
-
-        for manifest in self.loader.list_plugins():
-                all_tools.extend(self.get_plugin_tools(manifest.name))
-
-        return all_tools
+        return self._collect("tools")
 
     def get_all_skills(self) -> List[Dict[str, Any]]:
         """Get all skills from all loaded plugins."""
-        all_skills = []
-
-        for manifest in self.loader.list_plugins():
-                all_skills.extend(self.get_plugin_skills(manifest.name))
-
-        return all_skills
+        return self._collect("skills")
 
     def get_all_models(self) -> List[Dict[str, Any]]:
         """Get all models from all loaded plugins."""
-        all_models = []
-
-        for manifest in self.loader.list_plugins():
-                all_models.extend(self.get_plugin_models(manifest.name))
-
-        return all_models
+        return self._collect("models")
 
     def verify_permissions(self, plugin_name: str, required_permissions: List[str]) -> bool:
         """Verify plugin has required permissions."""
@@ -102,7 +106,7 @@ class PluginRegistry:
         if not plugin:
                 return False
 
-        return all(perm in plugin.permissions for perm in required_permissions)
+        return plugin.permissions_set.issuperset(required_permissions)
 
     def check_compatibility(self, plugin_name: str, min_version: str) -> bool:
         """Check if plugin is compatible with core version."""
@@ -111,8 +115,4 @@ class PluginRegistry:
         if not plugin:
                 return False
 
-        from packaging import version
-        plugin_version = version.parse(plugin.version)
-        min_version_req = version.parse(min_version)
-
-        return plugin_version >= min_version_req
+        return _parse_version(plugin.version) >= _parse_version(min_version)
@@ -1,9 +1,10 @@
 """Agent profile system for behavioral configuration."""
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+import sys
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentProfile:
     """Configuration profile that influences agent behavior."""
 
@@ -42,6 +43,13 @@ class AgentProfile:
     collaboration_mode: str = "independent"  # "independent", "cooperative", "competitive"
     task_decomposition: bool = True          # Break tasks into subtasks
 
+    # Derived in __post_init__ for get_model_selection_score
+    _preferred_set: FrozenSet[str] = field(init=False, repr=False, compare=False, default=None)
+    _penalties: Tuple[Tuple[str, float, float, float], ...] = field(init=False, repr=False, compare=False, default=None)
+    # Derived in __post_init__ for get_tool_usage_preference
+    _tool_pref_empty: str = field(init=False, repr=False, compare=False, default=None)
+    _tool_pref_nonempty: str = field(init=False, repr=False, compare=False, default=None)
+
     def __post_init__(self):
         """Validate profile parameters."""
         if self.creativity_vs_precision < 0.0 or self.creativity_vs_precision > 1.0:
@@ -56,38 +64,56 @@ class AgentProfile:
         if self.collaboration_mode not in ["independent", "cooperative", "competitive"]:
             raise ValueError("collaboration_mode must be 'independent', 'cooperative', or 'competitive'")
 
+        self._derive()
+
+    def _derive(self):
+        """Compute the cached scoring fields."""
+        # Interned names make the registry and preferred-provider lookups identity hits
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "_preferred_set", frozenset(
+            sys.intern(provider) for provider in self.preferred_providers or ()
+        ))
+        # (metric key, default, threshold, score delta) for each active penalty
+        object.__setattr__(self, "_penalties", tuple(
+            (key, default, threshold, delta)
+            for enabled, key, default, threshold, delta in (
+                (self.cost_sensitivity > 0.7, "cost_estimate", 0, 0.01, -0.3),     # Penalize expensive providers
+                (self.speed_vs_accuracy > 0.7, "avg_latency_ms", 1000, 2000, -0.2),  # Penalize slow providers
+                (self.risk_tolerance < 0.3, "error_rate", 0, 0.1, -0.4),           # Strongly penalize unreliable providers
+            )
+            if enabled
+        ))
+
+        # Tool usage preference with and without available tools
+        fallback = "skills" if self.prefer_skills_over_tools and self.enable_skill_system else "model"
+        object.__setattr__(self, "_tool_pref_empty", fallback)
+        object.__setattr__(self, "_tool_pref_nonempty", "tools" if self.prefer_tools_over_model else fallback)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary."""
-        return asdict(self)
+        return {name: getattr(self, name) for name in _TO_DICT_FIELDS}
+
+    @classmethod
+    def _unchecked(cls, **data) -> "AgentProfile":
+        """Build a profile from already-validated fields, skipping __post_init__ checks."""
+        profile = cls.__new__(cls)
+        for name, value in data.items():
+            object.__setattr__(profile, name, value)
+        profile._derive()
+        return profile
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AgentProfile":
         """Create profile from dictionary."""
-        return cls(**data)
+        return cls(**{key: value for key, value in data.items() if not key.startswith("_")})
 
     def get_model_selection_score(self, provider_name: str, metrics: Dict[str, Any]) -> float:
         """Calculate score for provider selection based on profile preferences."""
-        score = 0.0
-
-        # Check preferred providers
-        if self.preferred_providers and provider_name in self.preferred_providers:
-            score += 0.5
+        score = 0.5 if provider_name in self._preferred_set else 0.0
 
-        # Cost sensitivity
-        if self.cost_sensitivity > 0.7 and metrics.get("cost_estimate", 0) > 0.01:
-            score -= 0.3  # Penalize expensive providers
-
-        # Speed preference
-        if self.speed_vs_accuracy > 0.7:
-            latency = metrics.get("avg_latency_ms", 1000)
-            if latency > 2000:
-                score -= 0.2  # Penalize slow providers
-
-        # Risk tolerance (prefer stable providers)
-        if self.risk_tolerance < 0.3:
-            error_rate = metrics.get("error_rate", 0)
-            if error_rate > 0.1:
-                score -= 0.4  # Strongly penalize unreliable providers
+        for key, default, threshold, delta in self._penalties:
+            if metrics.get(key, default) > threshold:
+                score += delta
 
         return score
 
@@ -105,9 +131,8 @@ class AgentProfile:
 
     def get_tool_usage_preference(self, available_tools: list[str]) -> str:
         """Determine preferred approach for tool usage."""
-        if self.prefer_tools_over_model and available_tools:
-            return "tools"
-        elif self.prefer_skills_over_tools and self.enable_skill_system:
-            return "skills"
-        else:
-            return "model"
+        return self._tool_pref_nonempty if available_tools else self._tool_pref_empty
+
+
+# Public fields in declaration order; private fields are derived in __post_init__
+_TO_DICT_FIELDS = tuple(f.name for f in fields(AgentProfile) if not f.name.startswith("_"))
@@ -1,4 +1,5 @@
 """Built-in agent profiles for different behavioral styles."""
+import copy
 
 from ..profiles.base import AgentProfile
 
@@ -121,13 +122,15 @@ BUILT_IN_PROFILES = {
 
 def get_profile(name: str) -> AgentProfile:
     """Get a built-in profile by name."""
-    if name in BUILT_IN_PROFILES:
-        return BUILT_IN_PROFILES[name].__class__(
-            **BUILT_IN_PROFILES[name].to_dict()
-        )
-    else:
-        # Return balanced profile as default
-        return get_profile("balanced")
+    # Return balanced profile as default
+    prototype = BUILT_IN_PROFILES.get(name) or BUILT_IN_PROFILES["balanced"]
+
+    # Profiles are frozen, so a clone only needs its own preferred_providers list
+    if prototype.preferred_providers:
+        data = prototype.to_dict()
+        data["preferred_providers"] = list(prototype.preferred_providers)
+        return AgentProfile._unchecked(**data)
+    return copy.copy(prototype)
 
 
 def list_profiles() -> list[str]:
@@ -1,9 +1,15 @@
 """Profile registry for managing agent behavior configurations."""
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from .base import AgentProfile
 from .builtin import BUILT_IN_PROFILES, get_profile
+from .._json import dumps, loads
+
+
+# Profiles returned by ProfileRegistry.get_profile are shared, read-only instances;
+# use create_profile_from_template to derive a modified profile.
 
 
 class ProfileRegistry:
@@ -14,6 +20,12 @@ class ProfileRegistry:
         self.profiles_path.parent.mkdir(parents=True, exist_ok=True)
         self._custom_profiles: Dict[str, AgentProfile] = {}
         self._active_profile: Optional[str] = None
+        # name -> resolved profile; cleared whenever custom profiles change
+        self._resolved_cache: Dict[str, AgentProfile] = {}
+        # Save batching: bulk_update defers writes until the block exits
+        self._dirty = False
+        self._save_suspended = False
+        self._last_hash: Optional[int] = None
         self._load_custom_profiles()
         self._set_default_profile()
 
@@ -21,25 +33,60 @@ class ProfileRegistry:
         """Load custom profiles from disk."""
         if self.profiles_path.exists():
                 try:
-                        with open(self.profiles_path, "r", encoding="utf-8") as f:
-                                data = json.load(f)
-                                for name, profile_data in data.get("custom_profiles", {}).items():
-                                        profile = AgentProfile.from_dict(profile_data)
-                                        self._custom_profiles[name] = profile
+                        data = loads(self.profiles_path.read_bytes())
+                        for name, profile_data in data.get("custom_profiles", {}).items():
+                                profile = AgentProfile.from_dict(profile_data)
+                                self._custom_profiles[name] = profile
                 except (json.JSONDecodeError, IOError):
                         self._custom_profiles = {}
+        self._resolved_cache.clear()
 
     def _save_custom_profiles(self):
-        """Save custom profiles to disk."""
+        """Atomically save custom profiles to disk."""
         data = {
                 "custom_profiles": {
                         name: profile.to_dict()
                         for name, profile in self._custom_profiles.items()
                 }
         }
+        payload = dumps(data, indent=True)
+        self._dirty = False
 
-        with open(self.profiles_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+        # Skip the rewrite when nothing changed since the last save
+        payload_hash = hash(payload)
+        if payload_hash == self._last_hash:
+                return
+
+        temp_path = self.profiles_path.with_suffix(".tmp")
+        try:
+                temp_path.write_bytes(payload)
+                temp_path.replace(self.profiles_path)
+                self._last_hash = payload_hash
+        except (IOError, OSError):
+                if temp_path.exists():
+                        temp_path.unlink()
+                raise
+
+    def _mark_dirty(self):
+        """Save now, or defer the save while inside bulk_update."""
+        self._dirty = True
+        if not self._save_suspended:
+                self._save_custom_profiles()
+
+    @contextmanager
+    def bulk_update(self):
+        """Batch profile additions and removals into a single save."""
+        if self._save_suspended:
+                yield self
+                return
+
+        self._save_suspended = True
+        try:
+                yield self
+        finally:
+                self._save_suspended = False
+                if self._dirty:
+                        self._save_custom_profiles()
 
     def _set_default_profile(self):
         """Set default active profile."""
@@ -52,28 +99,36 @@ class ProfileRegistry:
                 return False  # Cannot override built-in profiles
 
         self._custom_profiles[profile.name] = profile
-        self._save_custom_profiles()
+        self._resolved_cache.clear()
+        self._mark_dirty()
         return True
 
     def remove_custom_profile(self, name: str) -> bool:
         """Remove a custom profile."""
         if name in self._custom_profiles:
                 del self._custom_profiles[name]
-                self._save_custom_profiles()
+                self._resolved_cache.clear()
+                self._mark_dirty()
                 return True
         return False
 
     def get_profile(self, name: str) -> Optional[AgentProfile]:
         """Get a profile by name."""
+        profile = self._resolved_cache.get(name)
+        if profile is not None:
+                return profile
+
         # Check custom profiles first
         if name in self._custom_profiles:
-                return self._custom_profiles[name]
-
+                profile = self._custom_profiles[name]
         # Check built-in profiles
-        if name in BUILT_IN_PROFILES:
-                return get_profile(name)
+        elif name in BUILT_IN_PROFILES:
+                profile = get_profile(name)
+        else:
+                return None
 
-        return None
+        self._resolved_cache[name] = profile
+        return profile
 
     def list_profiles(self) -> List[str]:
         """List all available profile names."""
@@ -122,6 +177,9 @@ class ProfileRegistry:
         profile_data.update(modifications)
         profile_data["name"] = name
         profile_data["description"] = f"Modified {template_name}: {modifications}"
+        if template.preferred_providers and "preferred_providers" not in modifications:
+                # to_dict does not copy; keep the new profile's list independent
+                profile_data["preferred_providers"] = list(template.preferred_providers)
 
         try:
                 new_profile = AgentProfile(**profile_data)
@@ -3,6 +3,9 @@ from typing import Dict, Any
 from ..models import ModelProvider
 
 
+_PREFIX = "[DUMMY] Processed: "
+
+
 class DummyProvider(ModelProvider):
     """Dummy provider for testing and development without API keys."""
 
@@ -12,7 +15,9 @@ class DummyProvider(ModelProvider):
         context: Dict[str, Any] = {}
     ) -> str:
         """Generate a deterministic dummy response."""
-        return f"[DUMMY] Processed: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
+        if len(prompt) <= 50:
+            return _PREFIX + prompt
+        return _PREFIX + prompt[:50] + "..."
 
     @property
     def supports_streaming(self) -> bool:
@@ -1,25 +1,45 @@
 """OpenAI provider for API key-based authentication."""
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Iterator, Optional
 from ..models import ModelProvider
 
 
+# One client (and its HTTP connection pool) per API key, shared by all providers
+_shared_clients: Dict[str, Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
 class OpenAIProvider(ModelProvider):
     """OpenAI provider using API key authentication."""
 
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
+        # The SDK is imported and the client built on first generate()
         self._client = None
+        self._client_unavailable = not self.api_key
 
-        if self.api_key:
-            try:
-                from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
-            except ImportError:
-                # Fallback if openai library not installed
-                self._client = None
-        else:
-            self._client = None
+    def _get_client(self) -> Optional[Any]:
+        """Return the OpenAI client, creating it once on first use."""
+        if self._client is not None or self._client_unavailable:
+            return self._client
+
+        with _shared_clients_lock:
+            if self._client is None and not self._client_unavailable:
+                client = _shared_clients.get(self.api_key)
+                if client is None:
+                    try:
+                        from openai import OpenAI
+                    except ImportError:
+                        # Fallback if openai library not installed
+                        self._client_unavailable = True
+                        return None
+                    # The SDK's default HTTP client keeps its own pool, limits
+                    # and timeouts; sharing the client is what reuses connections
+                    client = OpenAI(api_key=self.api_key)
+                    _shared_clients[self.api_key] = client
+                self._client = client
+        return self._client
 
     def generate(
         self,
@@ -27,11 +47,12 @@ class OpenAIProvider(ModelProvider):
         context: Dict[str, Any] = {}
     ) -> str:
         """Generate response using OpenAI API or stub."""
-        if not self._client or not self.api_key:
+        client = self._get_client()
+        if not client:
             return f"[OPENAI STUB] Processed: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
 
         try:
-            response = self._client.chat.completions.create(
+            response = client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=150,
@@ -41,6 +62,31 @@ class OpenAIProvider(ModelProvider):
         except Exception as e:
             return f"[OPENAI ERROR] {str(e)}"
 
+    def generate_stream(
+        self,
+        prompt: str,
+        context: Dict[str, Any] = {}
+    ) -> Iterator[str]:
+        """Stream response tokens from OpenAI API or stub."""
+        client = self._get_client()
+        if not client:
+            yield f"[OPENAI STUB] Processed: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
+            return
+
+        try:
+            stream = client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=150,
+                temperature=0.7,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            yield f"[OPENAI ERROR] {str(e)}"
+
     @property
     def supports_streaming(self) -> bool:
         return True
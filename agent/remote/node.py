@@ -1,12 +1,30 @@
 """Remote agent node representation."""
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 import json
+import operator
 from pathlib import Path
 
 
+# Nodes running this many tasks are not offered new ones
+MAX_ACTIVE_TASKS = 3
+
+# Required keys of a serialized node, fetched in one call by from_dict
+_REQUIRED_FIELDS = operator.itemgetter("node_id", "host", "port")
+
+
 class RemoteNode:
     """Represents a remote agent running the same core."""
 
+    __slots__ = (
+            "node_id",
+            "host",
+            "port",
+            "capabilities",
+            "_status",
+            "_last_heartbeat",
+            "_active_tasks"
+    )
+
     def __init__(
                 self,
                 node_id: str,
@@ -17,10 +35,10 @@ class RemoteNode:
         self.node_id = node_id
         self.host = host
         self.port = port
-        self.capabilities = capabilities
+        self.capabilities = frozenset(capabilities)
         self._status = "unknown"
         self._last_heartbeat = None
-        self._active_tasks: List[int] = []
+        self._active_tasks: Set[int] = set()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert node to dictionary for serialization."""
@@ -28,9 +46,9 @@ class RemoteNode:
                 "node_id": self.node_id,
                 "host": self.host,
                 "port": self.port,
-                "capabilities": self.capabilities,
+                "capabilities": sorted(self.capabilities),
                 "status": self._status,
-                "active_tasks": self._active_tasks,
+                "active_tasks": sorted(self._active_tasks),
                 "last_heartbeat": self._last_heartbeat
         }
 
@@ -40,13 +58,11 @@ class RemoteNode:
 
     def add_active_task(self, task_id: int):
         """Track active task on this node."""
-        if task_id not in self._active_tasks:
-                self._active_tasks.append(task_id)
+        self._active_tasks.add(task_id)
 
     def remove_active_task(self, task_id: int):
         """Remove task from active tracking."""
-        if task_id in self._active_tasks:
-                self._active_tasks.remove(task_id)
+        self._active_tasks.discard(task_id)
 
     def heartbeat(self, timestamp: float):
         """Update heartbeat timestamp."""
@@ -54,15 +70,14 @@ class RemoteNode:
 
     def is_available(self) -> bool:
         """Check if node is available for new tasks."""
-        return self._status == "online" and len(self._active_tasks) < 3
+        return self._status == "online" and len(self._active_tasks) < MAX_ACTIVE_TASKS
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RemoteNode":
         """Create node from dictionary."""
-        return cls(
-                node_id=data["node_id"],
-                host=data["host"],
-                port=data["port"],
-                capabilities=data.get("capabilities", []),
-                status=data.get("status", "unknown")
-        )
+        node_id, host, port = _REQUIRED_FIELDS(data)
+        node = cls(node_id, host, port, data.get("capabilities", ()))
+        node._status = data.get("status", "unknown")
+        node._active_tasks = set(data.get("active_tasks", ()))
+        node._last_heartbeat = data.get("last_heartbeat")
+        return node
@@ -1,6 +1,10 @@
 """Simple communication protocol for remote agent nodes."""
+import json
+import sys
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from enum import Enum
+from .._json import dumps, loads
 
 
 class MessageType(str, Enum):
@@ -14,9 +18,40 @@ class MessageType(str, Enum):
     SHUTDOWN = "shutdown"
 
 
+# Plain string values for the message factories; equal to the enum members
+_HEARTBEAT = MessageType.HEARTBEAT.value
+_TASK_ASSIGN = MessageType.TASK_ASSIGN.value
+_TASK_UPDATE = MessageType.TASK_UPDATE.value
+_TASK_COMPLETE = MessageType.TASK_COMPLETE.value
+_TASK_ERROR = MessageType.TASK_ERROR.value
+_SHUTDOWN = MessageType.SHUTDOWN.value
+
+
+def _dumps(data: Any) -> str:
+        """Serialize to compact JSON text."""
+        return dumps(data).decode("utf-8")
+
+
+@lru_cache(maxsize=1024)
+def _heartbeat_template(node_id: str) -> str:
+        """Encoded heartbeat for a node, up to but excluding the timestamp."""
+        encoded = _dumps(Message(msg_type=_HEARTBEAT, node_id=node_id, payload={"status": "alive"}).to_dict())
+        # to_dict ends with the timestamp key; cut its null value and the closing brace
+        return encoded[:-len("null}")]
+
+
+def _intern(value):
+        """Intern plain strings; enum members and None pass through."""
+        if type(value) is str:
+                return sys.intern(value)
+        return value
+
+
 class Message:
     """Base message class for protocol."""
 
+    __slots__ = ("msg_type", "payload", "node_id", "task_id", "error", "timestamp")
+
     def __init__(
                 self,
                 msg_type: str,
@@ -25,9 +60,9 @@ class Message:
                 task_id: Optional[int] = None,
                 error: Optional[str] = None
     ):
-        self.msg_type = msg_type
+        self.msg_type = _intern(msg_type)
         self.payload = payload or {}
-        self.node_id = node_id
+        self.node_id = _intern(node_id)
         self.task_id = task_id
         self.error = error
         self.timestamp = None
@@ -46,13 +81,15 @@ class Message:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
         """Create message from dictionary."""
-        msg = cls(
-                msg_type=data["msg_type"],
-                payload=data.get("payload", {}),
-                node_id=data.get("node_id"),
-                task_id=data.get("task_id"),
-                error=data.get("error")
-        )
+        # Fill slots directly instead of routing every field through __init__ kwargs
+        get = data.get
+        msg = cls.__new__(cls)
+        msg.msg_type = _intern(data["msg_type"])
+        msg.payload = get("payload") or {}
+        msg.node_id = _intern(get("node_id"))
+        msg.task_id = get("task_id")
+        msg.error = get("error")
+        msg.timestamp = get("timestamp")
         return msg
 
 
@@ -62,15 +99,18 @@ class ProtocolHandler:
     @staticmethod
     def encode(message: Message) -> str:
         """Encode message to JSON string."""
-        import json
-        return json.dumps(message.to_dict())
+        return _dumps(message.to_dict())
+
+    @staticmethod
+    def encode_heartbeat(node_id: str, timestamp: Optional[float] = None) -> str:
+        """Encode a heartbeat directly from a cached per-node template."""
+        return _heartbeat_template(node_id) + _dumps(timestamp) + "}"
 
     @staticmethod
     def decode(data: str) -> Message:
         """Decode JSON string to message."""
-        import json
         try:
-                msg_data = json.loads(data)
+                msg_data = loads(data)
                 return Message.from_dict(msg_data)
         except (json.JSONDecodeError, KeyError):
                 error_msg = Message(msg_type="error", error="Failed to decode message")
@@ -80,7 +120,7 @@ class ProtocolHandler:
     def create_heartbeat(node_id: str) -> Message:
         """Create heartbeat message."""
         return Message(
-                msg_type=MessageType.HEARTBEAT,
+                msg_type=_HEARTBEAT,
                 node_id=node_id,
                 payload={"status": "alive"}
         )
@@ -94,7 +134,7 @@ class ProtocolHandler:
     ) -> Message:
         """Create task assignment message."""
         return Message(
-                msg_type=MessageType.TASK_ASSIGN,
+                msg_type=_TASK_ASSIGN,
                 node_id=node_id,
                 task_id=task_id,
                 payload={
@@ -112,7 +152,7 @@ class ProtocolHandler:
     ) -> Message:
         """Create task update message."""
         return Message(
-                msg_type=MessageType.TASK_UPDATE,
+                msg_type=_TASK_UPDATE,
                 node_id=node_id,
                 task_id=task_id,
                 payload={
@@ -129,7 +169,7 @@ class ProtocolHandler:
     ) -> Message:
         """Create task completion message."""
         return Message(
-                msg_type=MessageType.TASK_COMPLETE,
+                msg_type=_TASK_COMPLETE,
                 node_id=node_id,
                 task_id=task_id,
                 payload={
@@ -145,7 +185,7 @@ class ProtocolHandler:
     ) -> Message:
         """Create task error message."""
         return Message(
-                msg_type=MessageType.TASK_ERROR,
+                msg_type=_TASK_ERROR,
                 node_id=node_id,
                 task_id=task_id,
                 error=error_msg
@@ -155,6 +195,6 @@ class ProtocolHandler:
     def create_shutdown(node_id: str) -> Message:
         """Create shutdown message."""
         return Message(
-                msg_type=MessageType.SHUTDOWN,
+                msg_type=_SHUTDOWN,
                 node_id=node_id
         )
@@ -1,8 +1,10 @@
 """Registry for remote agent nodes."""
 import json
-from typing import Dict, Any, Optional
+import sys
+from typing import Dict, Optional, Set
 from pathlib import Path
-from .node import RemoteNode
+from .node import MAX_ACTIVE_TASKS, RemoteNode
+from .._json import dumps, loads
 
 
 class NodeRegistry:
@@ -12,31 +14,58 @@ class NodeRegistry:
         self.nodes_path = Path(nodes_path)
         self.nodes_path.parent.mkdir(parents=True, exist_ok=True)
         self._nodes: Dict[str, RemoteNode] = {}
+        # Lookup indexes for find_available, kept in step with _nodes
+        self._online_nodes: Set[str] = set()
+        self._cap_to_nodes: Dict[str, Set[str]] = {}
+        # Registration sequence per node, so lookups prefer the earliest registered
+        self._reg_order: Dict[str, int] = {}
+        self._next_reg = 0
         self._load()
 
     def _load(self):
         """Load nodes from disk."""
         if self.nodes_path.exists():
                 try:
-                        with open(self.nodes_path, "r", encoding="utf-8") as f:
-                                data = json.load(f)
-                                for node_id, node_data in data.get("nodes", {}).items():
-                                        self._nodes[node_id] = RemoteNode.from_dict(node_data)
+                        data = loads(self.nodes_path.read_bytes())
+                        for node_id, node_data in data.get("nodes", {}).items():
+                                self._nodes[node_id] = RemoteNode.from_dict(node_data)
                 except (json.JSONDecodeError, IOError):
                         self._nodes = {}
 
+        for node_id, node in self._nodes.items():
+                self._index_node(node_id, node)
+
+    def _index_node(self, node_id: str, node: RemoteNode):
+        """Add a node to the online and capability indexes."""
+        if node_id not in self._reg_order:
+                self._reg_order[node_id] = self._next_reg
+                self._next_reg += 1
+        if node._status == "online":
+                self._online_nodes.add(node_id)
+        for cap in node.capabilities:
+                self._cap_to_nodes.setdefault(cap, set()).add(node_id)
+
+    def _unindex_node(self, node_id: str, node: RemoteNode):
+        """Remove a node from the online and capability indexes."""
+        self._online_nodes.discard(node_id)
+        for cap in node.capabilities:
+                node_ids = self._cap_to_nodes.get(cap)
+                if node_ids is not None:
+                        node_ids.discard(node_id)
+                        if not node_ids:
+                                del self._cap_to_nodes[cap]
+
     def _save(self):
         """Atomically save nodes to disk."""
         temp_path = self.nodes_path.with_suffix(".tmp")
         try:
-                with open(temp_path, "w", encoding="utf-8") as f:
-                        data = {
-                                "nodes": {
-                                        node_id: node.to_dict()
-                                        for node_id, node in self._nodes.items()
-                                }
+                data = {
+                        "nodes": {
+                                node_id: node.to_dict()
+                                for node_id, node in self._nodes.items()
                         }
-                        json.dump(data, f, indent=2)
+                }
+                temp_path.write_bytes(dumps(data, indent=True))
                 temp_path.replace(self.nodes_path)
         except (IOError, OSError):
                 if temp_path.exists():
@@ -45,14 +74,20 @@ class NodeRegistry:
 
     def register(self, node: RemoteNode):
         """Register a new remote node."""
+        node.node_id = sys.intern(node.node_id)
+        previous = self._nodes.get(node.node_id)
+        if previous is not None:
+                self._unindex_node(node.node_id, previous)
         self._nodes[node.node_id] = node
+        self._index_node(node.node_id, node)
         self._save()
         return True
 
     def unregister(self, node_id: str) -> bool:
         """Unregister a remote node."""
         if node_id in self._nodes:
-                del self._nodes[node_id]
+                self._unindex_node(node_id, self._nodes.pop(node_id))
+                del self._reg_order[node_id]
                 self._save()
                 return True
         return False
@@ -67,10 +102,18 @@ class NodeRegistry:
 
     def find_available(self, capabilities: list[str] = None) -> Optional[RemoteNode]:
         """Find available node matching capabilities."""
-        for node in self._nodes.values():
-                if node._status == "online":
-                        if not capabilities or all(cap in node.capabilities):
-                                return node
+        candidates = self._online_nodes
+        for cap in capabilities or ():
+                candidates = candidates & self._cap_to_nodes.get(cap, frozenset())
+                if not candidates:
+                        return None
+
+        # Only the candidates are visited, earliest registered first; the load
+        # is read from the node so direct add_active_task calls count
+        for node_id in sorted(candidates, key=self._reg_order.__getitem__):
+                node = self._nodes[node_id]
+                if len(node._active_tasks) < MAX_ACTIVE_TASKS:
+                        return node
         return None
 
     def update_node_status(self, node_id: str, status: str):
@@ -78,6 +121,10 @@ class NodeRegistry:
         node = self.get_node(node_id)
         if node:
                 node.update_status(status)
+                if status == "online":
+                        self._online_nodes.add(node_id)
+                else:
+                        self._online_nodes.discard(node_id)
                 self._save()
                 return True
         return False
@@ -1,14 +1,43 @@
 """Router policy system for intelligent provider selection."""
-from typing import Dict, Any, Optional
-from .model_metrics import ModelMetrics
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Optional, Tuple
+from .model_metrics import ModelMetrics, ProviderHealth
 from .models import ModelProvider
 
 
+# Latency score (lower is better): < 2000ms, < 5000ms, < 10000ms, slower
+_LATENCY_THRESHOLDS = (2000, 5000, 10000)
+_LATENCY_SCORES = (0.3, 0.2, 0.1, 0.0)
+
+# Success rate score: <= 0.7, <= 0.9, above 0.9
+_SUCCESS_THRESHOLDS = (0.7, 0.9)
+_SUCCESS_SCORES = (0.0, 0.1, 0.2)
+
+
 class RouterPolicy:
     """Policy-driven router for model provider selection."""
 
-    def __init__(self, metrics: ModelMetrics):
+    def __init__(self, metrics: ModelMetrics, health_ttl: float = 0.5):
         self.metrics = metrics
+        # provider -> (fetched at, metrics generation, health); reused within health_ttl
+        self.health_ttl = health_ttl
+        self._health_cache: Dict[str, Tuple[float, int, ProviderHealth]] = {}
+        # Router used to inspect providers, created on first use
+        self._router = None
+        self._supports_streaming: Dict[str, bool] = {}
+
+    def _get_cached_health(self, provider_name: str) -> ProviderHealth:
+        """Get provider health, reusing a recent snapshot if metrics are unchanged."""
+        now = time.monotonic()
+        generation = self.metrics.generation
+        cached = self._health_cache.get(provider_name)
+        if cached is not None and cached[1] == generation and now - cached[0] < self.health_ttl:
+                return cached[2]
+
+        health = self.metrics.get_provider_health(provider_name)
+        self._health_cache[provider_name] = (now, generation, health)
+        return health
 
     def select_provider(
                 self,
@@ -18,28 +47,20 @@ class RouterPolicy:
     ) -> Optional[str]:
         """Select best provider based on policy."""
 
-        available_providers = [
-                provider for provider in preferred_providers
-                if self.metrics.is_provider_available(provider)
-        ]
-
-        if not available_providers:
-                return None
+        # Single pass keeping the first highest-scoring available provider
+        best_name = None
+        best_score = 0.0
+        for provider_name in preferred_providers:
+                health = self._get_cached_health(provider_name)
+                if not health.available or health.in_cooldown:
+                        continue
 
-        # Score each provider
-        scored_providers = []
-        for provider_name in available_providers:
                 score = self._score_provider(provider_name, task_goal, allow_streaming)
-                scored_providers.append((score, provider_name))
+                if best_name is None or score > best_score:
+                        best_name = provider_name
+                        best_score = score
 
-        # Sort by score (descending)
-        scored_providers.sort(key=lambda x: x[0], reverse=True)
-
-        # Return highest-scoring provider
-        if scored_providers:
-                return scored_providers[0][1]
-
-        return None
+        return best_name
 
     def _score_provider(
                 self,
@@ -49,38 +70,29 @@ class RouterPolicy:
     ) -> float:
         """Calculate provider score (0-1)."""
 
-        health = self.metrics.get_provider_health(provider_name)
+        health = self._get_cached_health(provider_name)
 
-        if not health["available"] or health["in_cooldown"]:
+        if not health.available or health.in_cooldown:
                 return 0.0
 
         score = 0.0
 
         # Health score (weight: 0.4)
-        score += health["health_score"] * 0.4
+        score += health.health_score * 0.4
 
         # Latency score (weight: 0.3, lower is better)
-        if health["avg_latency_ms"] < 2000:
-                score += 0.3
-        elif health["avg_latency_ms"] < 5000:
-                score += 0.2
-        elif health["avg_latency_ms"] < 10000:
-                score += 0.1
+        score += _LATENCY_SCORES[bisect_right(_LATENCY_THRESHOLDS, health.avg_latency_ms)]
 
         # Success rate (weight: 0.2)
-        if health.get("success_rate", 0) > 0.9:
-                score += 0.2
-        elif health.get("success_rate", 0) > 0.7:
-                score += 0.1
+        score += _SUCCESS_SCORES[bisect_left(_SUCCESS_THRESHOLDS, health.success_rate)]
 
         # Streaming preference (weight: 0.1)
         if allow_streaming:
-                provider = self._get_provider(provider_name)
-                if provider and provider.supports_streaming:
+                if self._provider_supports_streaming(provider_name):
                         score += 0.1
 
         # Rate limit penalty
-        if health.get("rate_limited", False):
+        if health.rate_limited:
                 score -= 0.3
 
         return min(score, 1.0)
@@ -91,17 +103,27 @@ class RouterPolicy:
 
         return {
                 "name": provider_name,
-                "available": health["available"],
-                "health_score": health["health_score"],
-                "total_requests": health["total_requests"],
-                "success_rate": health.get("success_rate", 0),
-                "avg_latency_ms": health["avg_latency_ms"],
-                "rate_limited": health.get("rate_limited", False),
-                "in_cooldown": health["in_cooldown"]
+                "available": health.available,
+                "health_score": health.health_score,
+                "total_requests": health.total_requests,
+                "success_rate": health.success_rate,
+                "avg_latency_ms": health.avg_latency_ms,
+                "rate_limited": health.rate_limited,
+                "in_cooldown": health.in_cooldown
         }
 
     def _get_provider(self, provider_name: str) -> Optional[ModelProvider]:
         """Get provider instance by name (stub)."""
-        from .model_router import ModelRouter
-        router = ModelRouter()
-        return router.get_provider(provider_name)
+        if self._router is None:
+                from .model_router import ModelRouter
+                self._router = ModelRouter()
+        return self._router.get_provider(provider_name)
+
+    def _provider_supports_streaming(self, provider_name: str) -> bool:
+        """Whether a provider streams, looked up once per name."""
+        supports = self._supports_streaming.get(provider_name)
+        if supports is None:
+                provider = self._get_provider(provider_name)
+                supports = bool(provider and provider.supports_streaming)
+                self._supports_streaming[provider_name] = supports
+        return supports
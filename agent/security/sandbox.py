@@ -1,10 +1,50 @@
 """Process sandboxing for isolation and resource limits."""
+import functools
 import os
-import signal
 import resource
+import selectors
 import time
-from typing import Optional, Dict, Any
-from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple
+
+
+_TRUNCATED_MARKER = b"\n... [output truncated]"
+
+
+def _child_limits(
+        max_cpu_time: int,
+        max_memory_mb: int,
+        max_processes: int,
+        nofile_cap: int = 1024
+) -> List[Tuple[int, Tuple[int, int]]]:
+    """Build (resource, (soft, hard)) caps for a sandboxed child."""
+    caps = (
+        (resource.RLIMIT_CPU, int(max_cpu_time)),
+        (resource.RLIMIT_AS, int(max_memory_mb * 1024 * 1024)),
+        (resource.RLIMIT_NPROC, int(max_processes)),
+        (resource.RLIMIT_NOFILE, int(nofile_cap)),
+    )
+    limits = []
+    for res, cap in caps:
+        try:
+            soft, hard = resource.getrlimit(res)
+        except (ValueError, OSError):
+            continue
+        new_hard = cap if hard == resource.RLIM_INFINITY else min(hard, cap)
+        new_soft = new_hard if soft == resource.RLIM_INFINITY else min(soft, new_hard)
+        limits.append((res, (new_soft, new_hard)))
+    return limits
+
+
+def _limit_child_resources(limits: List[Tuple[int, Tuple[int, int]]] = (), nice: int = 5):
+    """Limit child process resources (runs in child after fork)."""
+    # Set nice level to lower priority
+    os.nice(nice)
+
+    for res, limit in limits:
+        try:
+            resource.setrlimit(res, limit)
+        except (ValueError, OSError):
+            pass
 
 
 class SandboxError(Exception):
@@ -19,120 +59,92 @@ class ProcessSandbox:
         self,
         max_cpu_time: float = 30.0,
         max_memory_mb: int = 1024,
-        max_processes: int = 100
+        max_processes: int = 100,
+        max_output_bytes: int = 1024 * 1024
     ):
         self.max_cpu_time = max_cpu_time
         self.max_memory_mb = max_memory_mb
         self.max_processes = max_processes
+        self.max_output_bytes = max_output_bytes
         self._child_processes: dict = {}
 
-    def _limit_child_resources(self):
-        """Limit child process resources (runs in child after fork)."""
-        # Set nice level to lower priority
-        os.nice(5)
+    def run(self, cmd: list, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run command in sandbox with resource limits."""
+        import subprocess
+
+        limits = _child_limits(self.max_cpu_time, self.max_memory_mb, self.max_processes)
 
-        # Limit file descriptors
-        try:
-            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
-            new_hard = min(hard, 1024)
-            resource.setrlimit(
-                resource.RLIMIT_NOFILE,
-                (soft, new_hard)
-            )
-        except (ValueError, OSError):
-            pass
+        # Limits are applied in the child before exec, so nothing it runs
+        # (or forks) ever executes uncapped
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=True,
+            preexec_fn=functools.partial(_limit_child_resources, limits)
+        )
 
-    @contextmanager
-    def run(self, cmd: list, timeout: Optional[float] = None):
-        """Run command in sandbox with resource limits."""
+        timeout = timeout or self.max_cpu_time
+        start_time = time.time()
 
-        def timeout_handler(signum, frame):
+        try:
+            stdout, stderr = self._read_output(proc, timeout)
+            proc.wait(timeout=max(0.0, timeout - (time.time() - start_time)))
+            elapsed = time.time() - start_time
+
+            return {
+                "returncode": proc.returncode,
+                "stdout": stdout.decode('utf-8', errors='replace'),
+                "stderr": stderr.decode('utf-8', errors='replace'),
+                "elapsed": elapsed
+            }
+
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
             raise SandboxError(f"Process timed out after {timeout}s")
 
-        try:
-            # Set resource limits before spawning
-            soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
-            new_hard = min(int(hard), int(self.max_cpu_time))
-
-            # Set CPU time limit
-            resource.setrlimit(
-                resource.RLIMIT_CPU,
-                (self.max_cpu_time, new_hard)
-            )
-
-            # Set address space limit (best-effort, works on Linux)
-            try:
-                soft, hard = resource.getrlimit(resource.RLIMIT_AS)
-                new_soft = min(int(soft), int(self.max_memory_mb * 1024 * 1024))  # MB to bytes
-                resource.setrlimit(
-                    resource.RLIMIT_AS,
-                    (new_soft, int(hard))
-                )
-            except (ValueError, OSError):
-                # AS limit may not be available on all systems
-                pass
-
-            # Set max number of processes
-            try:
-                soft, hard = resource.getrlimit(resource.RLIMIT_NPROC)
-                new_soft = min(int(soft), int(self.max_processes))
-                resource.setrlimit(
-                    resource.RLIMIT_NPROC,
-                    (new_soft, int(hard))
-                )
-            except (ValueError, OSError):
-                pass
-
-            # Spawn process with limits
-            import subprocess
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=self._limit_child_resources
-            )
-
-            timeout = timeout or self.max_cpu_time
-            start_time = time.time()
-
-            try:
-                returncode, stdout, stderr = proc.communicate(timeout=timeout)
-                elapsed = time.time() - start_time
-
-                return {
-                    "returncode": returncode,
-                    "stdout": stdout.decode('utf-8', errors='replace') if stdout else "",
-                    "stderr": stderr.decode('utf-8', errors='replace') if stderr else "",
-                    "elapsed": elapsed
-                }
-
-            except subprocess.TimeoutExpired:
-                proc.kill()
-                raise SandboxError(f"Process timed out after {timeout}s")
-
-            except Exception as e:
-                proc.kill()
-                raise SandboxError(f"Process failed: {str(e)}")
-
-        finally:
-            signal.signal(signal.SIGALRM, signal.SIG_DFL)
-
-    def _limit_child_resources(self):
-        """Limit child process resources (runs in child after fork)."""
-        # This runs in the child process after fork
-        # Set nice level to lower priority
-        os.nice(5)
-
-        # Limit file descriptors
-        try:
-                soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
-                new_hard = min(hard, 1024)
-                resource.setrlimit(
-                        resource.RLIMIT_NOFILE,
-                        (soft, new_hard)
-                )
-        except (ValueError, OSError):
-                pass
+        except Exception as e:
+            proc.kill()
+            proc.wait()
+            raise SandboxError(f"Process failed: {str(e)}")
+
+    def _read_output(self, proc, timeout: float) -> Tuple[bytes, bytes]:
+        """Drain stdout/stderr, keeping at most max_output_bytes of each."""
+        import subprocess
+
+        limit = self.max_output_bytes
+        buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+        truncated = set()
+        deadline = time.time() + timeout
+
+        with selectors.DefaultSelector() as sel:
+            for stream in buffers:
+                sel.register(stream, selectors.EVENT_READ)
+
+            while sel.get_map():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout)
+
+                for key, _ in sel.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        key.fileobj.close()
+                        continue
+
+                    # Keep draining past the cap so the child never blocks on a full pipe
+                    buf = buffers[key.fileobj]
+                    room = limit - len(buf)
+                    if room > 0:
+                        buf += chunk[:room]
+                    if len(chunk) > room:
+                        truncated.add(key.fileobj)
+
+        for stream in truncated:
+            buffers[stream] += _TRUNCATED_MARKER
+        return bytes(buffers[proc.stdout]), bytes(buffers[proc.stderr])
 
     def get_usage(self) -> dict:
         """Get current resource usage."""
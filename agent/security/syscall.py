@@ -1,10 +1,63 @@
 """Syscall monitoring and filtering (best-effort, portable)."""
 import os
+import re
+import atexit
+import threading
 import subprocess
 import time
-from typing import List, Set, Dict, Any, Optional
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Set, Dict, Any, Optional
 import json
 from pathlib import Path
+from .._json import dumps
+
+try:
+        import ahocorasick
+except ImportError:
+        # Optional; fall back to a compiled regex alternation
+        ahocorasick = None
+
+# Characters that continue a token; a pattern must not touch them on either side
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_.-")
+
+
+def _is_bounded(text: str, start: int, end: int) -> bool:
+        """Whether text[start:end] is not part of a longer word or token."""
+        return ((start == 0 or text[start - 1] not in _TOKEN_CHARS)
+                and (end == len(text) or text[end] not in _TOKEN_CHARS))
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Callable[[str], Iterator[str]]:
+        """Build a case-insensitive multi-pattern scanner.
+
+        The returned function yields the original pattern for each leftmost-longest,
+        non-overlapping match in a single pass over the text. Matches must stand
+        on token boundaries, so "nc" does not fire on "func.py" or "once".
+        """
+        by_text = {pattern.lower(): pattern for pattern in patterns if pattern}
+        if not by_text:
+                return lambda text: iter(())
+
+        if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for text, pattern in by_text.items():
+                        automaton.add_word(text, (len(text), pattern))
+                automaton.make_automaton()
+
+                def scan(text: str) -> Iterator[str]:
+                        lowered = text.lower()
+                        for end, (length, pattern) in automaton.iter_long(lowered):
+                                if _is_bounded(lowered, end + 1 - length, end + 1):
+                                        yield pattern
+
+                return scan
+
+        regex = re.compile(
+                r"(?<![\w.-])(?:"
+                + "|".join(re.escape(text) for text in sorted(by_text, key=len, reverse=True))
+                + r")(?![\w.-])",
+                re.IGNORECASE
+        )
+        return lambda text: (by_text[match.group(0).lower()] for match in regex.finditer(text))
 
 
 class SyscallFilter:
@@ -31,6 +84,33 @@ class SyscallFilter:
                 "kill", "ptrace", "killpg"
         }
 
+    # Dangerous command patterns, grouped by category
+    DANGEROUS_PATTERNS = (
+                # sudo, doas, pkexec
+                ("sudo", "doas", "pkexec"),
+
+                # Package managers auto-installing
+                ("apt install", "apt-get install", "pip install", "npm install"),
+
+                # Network operations
+                ("wget", "curl", "nc", "ncat", "telnet"),
+
+                # System modifications
+                ("iptables", "ufw", "mount", "umount"),
+
+                # Process manipulation
+                ("killall", "pkill", "kill -9", "kill -SIGKILL")
+        )
+
+    # Single-pass scanner over every dangerous pattern
+    _scan_dangerous = staticmethod(_compile_patterns(
+                pattern for group in DANGEROUS_PATTERNS for pattern in group
+        ))
+
+    # Syscall log batching: flush after this many entries or seconds
+    LOG_FLUSH_ENTRIES = 256
+    LOG_FLUSH_INTERVAL = 1.0
+
     def __init__(
                 self,
                 allowlist: Optional[Set[str]] = None,
@@ -39,11 +119,24 @@ class SyscallFilter:
     ):
         self.allowlist = set(allowlist) if allowlist else set()
         self.denylist = set(denylist) if denylist else set()
+        # Allowlist scanner, rebuilt only when the allowlist changes
+        self._allow_key: Optional[FrozenSet[str]] = None
+        self._scan_allowed: Callable[[str], Iterator[str]] = _compile_patterns(())
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Attempt entries go next to the counter file so counter rewrites cannot clobber them
+        self.attempts_path = self.log_path.with_suffix(".jsonl")
         self._blocked_count = 0
+        self._counter_dirty = False
         self._load_blocked_count()
 
+        # Buffered syscall log lines, written through one long-lived handle
+        self._log_lock = threading.Lock()
+        self._log_buffer: List[bytes] = []
+        self._log_fh = None
+        self._last_log_flush = time.monotonic()
+        atexit.register(self._flush)
+
     def _load_blocked_count(self):
         """Load blocked syscall count from previous runs."""
         if self.log_path.exists():
@@ -55,57 +148,50 @@ class SyscallFilter:
                         self._blocked_count = 0
 
     def _save_blocked_count(self):
-        """Save blocked syscall count."""
+        """Atomically save blocked syscall count."""
         data = {
                 "total_blocked": self._blocked_count,
-                "last_updated": time.time()
+                "last_updated_ns": time.time_ns()
         }
 
-        with open(self.log_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+        temp_path = self.log_path.with_suffix(".tmp")
+        try:
+                with open(temp_path, "wb") as f:
+                        f.write(dumps(data))
+                os.replace(temp_path, self.log_path)
+                self._counter_dirty = False
+        except (IOError, OSError):
+                if temp_path.exists():
+                        temp_path.unlink()
+                raise
 
     def check_command(self, command: str) -> Dict[str, Any]:
         """Check if command should be allowed based on syscall patterns."""
 
-        # Parse command to detect dangerous operations
-        dangerous_patterns = [
-                # sudo, doas, pkexec
-                ("sudo", "doas", "pkexec"),
-
-                # Package managers auto-installing
-                ("apt install", "apt-get install", "pip install", "npm install"),
-
-                # Network operations
-                ("wget", "curl", "nc", "ncat", "telnet"),
-
-                # System modifications
-                ("iptables", "ufw", "mount", "umount"),
-
-                # Process manipulation
-                ("killall", "pkill", "kill -9", "kill -SIGKILL")
-        ]
-
         warnings = []
         blocked_reasons = []
 
-        for pattern in dangerous_patterns:
-                if pattern in command.lower():
-                        # Check if in denylist
-                        if self.denylist and pattern in self.denylist:
-                                blocked_reasons.append(f"Explicitly denied: {pattern}")
-                                self._blocked_count += 1
-                        elif self.allowlist:
-                                # Check if allowed
-                                allowed = any(a in command.lower() for a in self.allowlist)
-                                if not allowed:
-                                        blocked_reasons.append(f"Not in allowlist: {pattern}")
-                                        self._blocked_count += 1
-                        else:
-                                blocked_reasons.append(f"Suspicious pattern: {pattern}")
-                                self._blocked_count += 1
+        # One scan over the command; each distinct pattern is reported once
+        matched = dict.fromkeys(self._scan_dangerous(command))
+
+        for pattern in matched:
+                # Check if in denylist
+                if self.denylist and pattern in self.denylist:
+                        blocked_reasons.append(f"Explicitly denied: {pattern}")
+                elif self.allowlist:
+                        # Check if allowed
+                        allowed = self._is_allowlisted(command)
+                        if not allowed:
+                                blocked_reasons.append(f"Not in allowlist: {pattern}")
+                else:
+                        blocked_reasons.append(f"Suspicious pattern: {pattern}")
 
         if blocked_reasons:
-                self._save_blocked_count()
+                # Counted under the flush lock; persisted by the next batched flush
+                with self._log_lock:
+                        self._blocked_count += len(blocked_reasons)
+                        self._counter_dirty = True
+                        self._flush_if_due()
                 return {
                         "allowed": False,
                         "blocked": True,
@@ -118,6 +204,16 @@ class SyscallFilter:
                 "reasons": warnings
         }
 
+    def _is_allowlisted(self, command: str) -> bool:
+        """Whether any allowlist entry occurs in the command."""
+        allow_key = frozenset(self.allowlist)
+        if allow_key != self._allow_key:
+                self._allow_key = allow_key
+                self._scan_allowed = _compile_patterns(allow_key)
+        if "" in allow_key:
+                return True
+        return next(self._scan_allowed(command), None) is not None
+
     def log_syscall_attempt(self, syscall_name: str, pid: int, allowed: bool):
         """Log syscall attempt."""
 
@@ -125,11 +221,46 @@ class SyscallFilter:
                 "syscall": syscall_name,
                 "pid": pid,
                 "allowed": allowed,
-                "timestamp": time.time()
+                "timestamp_ns": time.time_ns()
         }
 
-        with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry) + "\n")
+        line = dumps(log_entry) + b"\n"
+        with self._log_lock:
+                self._log_buffer.append(line)
+                self._flush_if_due()
+
+    def _flush_if_due(self):
+        """Flush once the batch is full or stale; caller holds _log_lock."""
+        if (len(self._log_buffer) >= self.LOG_FLUSH_ENTRIES
+                        or time.monotonic() - self._last_log_flush > self.LOG_FLUSH_INTERVAL):
+                self._flush_locked()
+
+    def _flush(self):
+        """Write buffered syscall log entries."""
+        with self._log_lock:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        """Write buffered entries and a dirty counter; caller holds _log_lock."""
+        self._last_log_flush = time.monotonic()
+        if self._counter_dirty:
+                self._save_blocked_count()
+        if not self._log_buffer:
+                return
+        if self._log_fh is None:
+                self._log_fh = open(self.attempts_path, "ab", buffering=1 << 16)
+        self._log_fh.write(b"".join(self._log_buffer))
+        self._log_fh.flush()
+        self._log_buffer = []
+
+    def close(self):
+        """Flush pending entries, close the log handle and drop the exit hook."""
+        atexit.unregister(self._flush)
+        with self._log_lock:
+                self._flush_locked()
+                if self._log_fh is not None:
+                        self._log_fh.close()
+                        self._log_fh = None
 
     def get_blocked_count(self) -> int:
         """Get total number of blocked syscalls."""
@@ -137,5 +268,6 @@ class SyscallFilter:
 
     def reset_blocked_count(self):
         """Reset blocked syscall counter."""
-        self._blocked_count = 0
-        self._save_blocked_count()
+        with self._log_lock:
+                self._blocked_count = 0
+                self._save_blocked_count()
@@ -1,4 +1,5 @@
 """Base skill abstraction for composable, reusable skill patterns."""
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Set
 from ..task import Task
@@ -24,11 +25,21 @@ class Skill(ABC):
         self.trigger_patterns = trigger_patterns or []
         self.required_tools = required_tools or []
         self.constraints = constraints or {}
+        self._required_tools_set = frozenset(self.required_tools)
+
+        # Lowercased trigger patterns as one alternation, matched once per task
+        self._trigger_re = re.compile(
+                "|".join(re.escape(pattern.lower()) for pattern in self.trigger_patterns)
+        ) if self.trigger_patterns else None
 
         # Runtime state
         self._context: Dict[str, Any] = {}
         self._subtasks: List[Task] = []
 
+        # Tool handles resolved by bind_registries for the registry they came from
+        self._bound_registry = None
+        self._bound_tools: Dict[str, Any] = {}
+
     @abstractmethod
     def execute(self, task: Task, context: Dict[str, Any] = {}) -> Dict[str, Any]:
         """Execute the skill on a task.
@@ -44,19 +55,34 @@ class Skill(ABC):
 
     def can_handle_task(self, task: Task) -> bool:
         """Check if this skill can handle the given task."""
-        task_description = f"{task.goal} {task.description if hasattr(task, 'description') else ''}"
-
-        # Check trigger patterns
-        for pattern in self.trigger_patterns:
-                if pattern.lower() in task_description.lower():
-                        return True
-
-        return False
+        if self._trigger_re is None:
+                return False
+
+        task_description = getattr(task, "search_text_lc", None)
+        if task_description is None:
+                task_description = f"{task.goal} {getattr(task, 'description', '')}".lower()
+        return self._trigger_re.search(task_description) is not None
+
+    def bind_registries(self, tool_registry, model_router=None):
+        """Attach registries, resolving required tools once per tool registry."""
+        self.tool_registry = tool_registry
+        self.model_router = model_router
+        if self._bound_registry is not tool_registry:
+                self._bound_registry = tool_registry
+                self._bound_tools = {name: tool_registry.get(name) for name in self.required_tools}
+
+    def _get_tool(self, name: str):
+        """Get a tool, using the bound handle while the registry is unchanged."""
+        if self._bound_registry is self.tool_registry:
+                tool = self._bound_tools.get(name)
+                if tool is not None:
+                        return tool
+        # Not required, not bound, or registered after binding
+        return self.tool_registry.get(name)
 
     def validate_requirements(self, available_tools: Set[str]) -> bool:
         """Validate that required tools are available."""
-        missing_tools = set(self.required_tools) - available_tools
-        return len(missing_tools) == 0
+        return self._required_tools_set <= available_tools
 
     def get_required_tools(self) -> List[str]:
         """Get list of tools required by this skill."""
@@ -1,9 +1,12 @@
 """Code review skill that analyzes code quality and provides suggestions."""
+import re
 from typing import Dict, Any
 from ..base import Skill
 from ...model_router import ModelRouter
 from ...tools.registry import ToolRegistry
 
+_FILE_RE = re.compile(r'(?:review|analyze|check)\s+(.+\.\w+)')
+
 
 class CodeReviewSkill(Skill):
     """Skill for reviewing code and providing improvement suggestions."""
@@ -25,6 +28,9 @@ class CodeReviewSkill(Skill):
         )
         self.model_router = None
         self.tool_registry = None
+        # Constraint values read on every execute
+        self._max_file_size = self.constraints["max_file_size"]
+        self._supported_exts = frozenset(self.constraints["supported_extensions"])
 
     def execute(self, task, context: Dict[str, Any] = {}) -> Dict[str, Any]:
         """Execute code review on task."""
@@ -33,8 +39,7 @@ class CodeReviewSkill(Skill):
         file_path = None
 
         # Simple pattern matching for file paths
-        import re
-        file_match = re.search(r'(?:review|analyze|check)\s+(.+\.\w+)', goal)
+        file_match = _FILE_RE.search(goal)
         if file_match:
                 file_path = file_match.group(1).strip()
 
@@ -44,12 +49,21 @@ class CodeReviewSkill(Skill):
                         "error": "Could not identify file to review from task goal"
                 }
 
-        # Read file content
-        file_tool = self.tool_registry.get("file_read")
+        # Check file extension before doing any I/O
+        import os
+        _, ext = os.path.splitext(file_path)
+        if ext not in self._supported_exts:
+                return {
+                        "success": False,
+                        "error": f"Unsupported file type {ext}. Supported: {', '.join(self.constraints['supported_extensions'])}"
+                }
+
+        # Read file content, capped at the size limit
+        file_tool = self._get_tool("file_read")
         if not file_tool:
                 return {"success": False, "error": "File read tool not available"}
 
-        read_result = file_tool.execute(filepath=file_path)
+        read_result = file_tool.execute(filepath=file_path, max_bytes=self._max_file_size)
 
         if read_result.get("error"):
                 return {
@@ -60,19 +74,10 @@ class CodeReviewSkill(Skill):
         code_content = read_result.get("output", "")
 
         # Check file size constraint
-        if len(code_content) > self.constraints["max_file_size"]:
+        if read_result.get("truncated"):
                 return {
                         "success": False,
-                        "error": f"File too large ({len(code_content)} bytes, max {self.constraints['max_file_size']})"
-                }
-
-        # Check file extension
-        import os
-        _, ext = os.path.splitext(file_path)
-        if ext not in self.constraints["supported_extensions"]:
-                return {
-                        "success": False,
-                        "error": f"Unsupported file type {ext}. Supported: {', '.join(self.constraints['supported_extensions'])}"
+                        "error": f"File too large (over {self._max_file_size} bytes)"
                 }
 
         # Generate review using model
@@ -1,9 +1,14 @@
 """Debug skill that diagnoses errors and provides troubleshooting assistance."""
+import re
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from ..base import Skill
 from ...tools.registry import ToolRegistry
 from ...model_router import ModelRouter
 
+_ERROR_RE = re.compile(r'(?:debug|fix|diagnose)\s+(.+)')
+
 
 class DebugSkill(Skill):
     """Skill for debugging errors and diagnosing issues."""
@@ -25,6 +30,11 @@ class DebugSkill(Skill):
         )
         self.tool_registry = None
         self.model_router = None
+        # Constraint values read on every execute; log globs compiled into one regex
+        self._max_log_files = self.constraints["max_log_files"]
+        self._log_re = re.compile(
+                "|".join(fnmatch.translate(pattern) for pattern in self.constraints["log_file_patterns"])
+        )
 
     def execute(self, task, context: Dict[str, Any] = {}) -> Dict[str, Any]:
         """Execute debugging analysis on task."""
@@ -36,35 +46,34 @@ class DebugSkill(Skill):
         system_info = {}
 
         # Check for error messages in goal
-        import re
-        error_match = re.search(r'(?:debug|fix|diagnose)\s+(.+)', goal)
+        error_match = _ERROR_RE.search(goal)
         if error_match:
                 error_message = error_match.group(1).strip()
 
         # Look for log files in current directory
-        list_tool = self.tool_registry.get("list_dir")
+        list_tool = self._get_tool("list_dir")
         if list_tool:
                 list_result = list_tool.execute(path=".")
                 if not list_result.get("error"):
                         files = list_result.get("output", "").strip().split('\n')
-                        for file in files:
-                                if any(file.endswith(pattern[1:]) for pattern in self.constraints["log_file_patterns"]):
-                                        log_files.append(file)
+                        log_match = self._log_re.match
+                        log_files = [file for file in files if log_match(file)]
 
         # Limit log files
-        log_files = log_files[:self.constraints["max_log_files"]]
+        log_files = log_files[:self._max_log_files]
 
         # Read log files
         log_contents = {}
-        file_tool = self.tool_registry.get("file_read")
-        if file_tool:
-                for log_file in log_files:
-                        read_result = file_tool.execute(filepath=log_file)
-                        if not read_result.get("error"):
-                                log_contents[log_file] = read_result.get("output", "")[:5000]  # Limit content
+        file_tool = self._get_tool("file_read")
+        if file_tool and log_files:
+                with ThreadPoolExecutor(max_workers=len(log_files)) as pool:
+                        read_results = pool.map(lambda f: file_tool.execute(filepath=f), log_files)
+                        for log_file, read_result in zip(log_files, read_results):
+                                if not read_result.get("error"):
+                                        log_contents[log_file] = read_result.get("output", "")[:5000]  # Limit content
 
         # Get system information
-        shell_tool = self.tool_registry.get("shell")
+        shell_tool = self._get_tool("shell")
         if shell_tool:
                 # Get basic system info (safe commands only)
                 safe_commands = [
@@ -74,10 +83,12 @@ class DebugSkill(Skill):
                         "ps aux | head -10"
                 ]
 
-                for cmd in safe_commands:
-                        result = shell_tool.execute(command=cmd)
-                        if not result.get("error"):
-                                system_info[cmd] = result.get("output", "")
+                # Probes are independent; run them concurrently
+                with ThreadPoolExecutor(max_workers=len(safe_commands)) as pool:
+                        results = pool.map(lambda c: shell_tool.execute(command=c), safe_commands)
+                        for cmd, result in zip(safe_commands, results):
+                                if not result.get("error"):
+                                        system_info[cmd] = result.get("output", "")
 
         # Analyze with model
         analysis_prompt = f"""
@@ -1,8 +1,92 @@
 """File organization skill that organizes and cleans up directories."""
-from typing import Dict, Any, List
+import ctypes
+import errno
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from ..base import Skill
 from ...tools.registry import ToolRegistry
 
+_DIR_RE = re.compile(r'(?:organize|clean|sort)\s+(?:files\s+in\s+)?(.+)')
+
+# os.replace shares os.rename's implementation but is not listed in supports_dir_fd
+_DIR_FD_SUPPORTED = (
+        hasattr(os, "O_DIRECTORY")
+        and os.rename in os.supports_dir_fd
+        and os.unlink in os.supports_dir_fd
+)
+
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+# renameat2 is Linux/glibc only; elsewhere moves fall back to os.replace
+try:
+        _renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+        _renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+        _renameat2.restype = ctypes.c_int
+except (OSError, AttributeError):
+        _renameat2 = None
+
+
+def _fast_move(
+        src: str,
+        dst: str,
+        src_dir_fd: Optional[int] = None,
+        dst_dir_fd: Optional[int] = None,
+        src_path: Optional[str] = None,
+        dst_path: Optional[str] = None
+):
+        """Move a file with one rename, never replacing an existing destination."""
+        src_path = src_path or src
+        dst_path = dst_path or dst
+
+        if _renameat2 is not None:
+                rc = _renameat2(
+                        _AT_FDCWD if src_dir_fd is None else src_dir_fd, os.fsencode(src),
+                        _AT_FDCWD if dst_dir_fd is None else dst_dir_fd, os.fsencode(dst),
+                        _RENAME_NOREPLACE
+                )
+                if rc == 0:
+                        return
+                err = ctypes.get_errno()
+                if err == errno.EXDEV:
+                        return _copy_move(src_path, dst_path)
+                if err not in (errno.ENOSYS, errno.EINVAL):
+                        raise OSError(err, os.strerror(err), src_path, None, dst_path)
+                # Kernel or filesystem without RENAME_NOREPLACE: plain rename below
+
+        if os.path.lexists(dst_path):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), src_path, None, dst_path)
+        try:
+                os.replace(src, dst, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+        except OSError as e:
+                if e.errno != errno.EXDEV:
+                        raise
+                _copy_move(src_path, dst_path)
+
+
+def _copy_move(src_path: str, dst_path: str):
+        """Move across filesystems, refusing to overwrite the destination."""
+        if os.path.lexists(dst_path):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), src_path, None, dst_path)
+        shutil.move(src_path, dst_path)
+
+
+_EXT_CATEGORIES = {
+        ext: category
+        for category, exts in (
+                ("python", (".py", ".pyc")),
+                ("javascript", (".js", ".ts", ".jsx", ".tsx")),
+                ("documents", (".txt", ".md", ".doc", ".pdf")),
+                ("images", (".jpg", ".png", ".gif", ".svg")),
+                ("logs", (".log",)),
+                ("temp", (".tmp", ".bak", ".swp")),
+        )
+        for ext in exts
+}
+
 
 class FileOrganizationSkill(Skill):
     """Skill for organizing files and directories."""
@@ -23,18 +107,18 @@ class FileOrganizationSkill(Skill):
                 }
         )
         self.tool_registry = None
+        self._max_workers = 8
 
     def execute(self, task, context: Dict[str, Any] = {}) -> Dict[str, Any]:
         """Execute file organization on task."""
         goal = task.goal.lower()
 
         # Extract directory path from task goal
-        import re
-        dir_match = re.search(r'(?:organize|clean|sort)\s+(?:files\s+in\s+)?(.+)', goal)
+        dir_match = _DIR_RE.search(goal)
         target_dir = dir_match.group(1).strip() if dir_match else "."
 
         # List directory contents
-        list_tool = self.tool_registry.get("list_dir")
+        list_tool = self._get_tool("list_dir")
         if not list_tool:
                 return {"success": False, "error": "List directory tool not available"}
 
@@ -95,20 +179,8 @@ class FileOrganizationSkill(Skill):
                 if file.startswith('.') or '/' in file:
                         continue  # Skip hidden files and subdirs for now
 
-                if file.endswith(('.py', '.pyc')):
-                        file_types["python"].append(file)
-                elif file.endswith(('.js', '.ts', '.jsx', '.tsx')):
-                        file_types["javascript"].append(file)
-                elif file.endswith(('.txt', '.md', '.doc', '.pdf')):
-                        file_types["documents"].append(file)
-                elif file.endswith(('.jpg', '.png', '.gif', '.svg')):
-                        file_types["images"].append(file)
-                elif file.endswith(('.log',)):
-                        file_types["logs"].append(file)
-                elif any(file.endswith(ext) for ext in ['.tmp', '.bak', '.swp']):
-                        file_types["temp"].append(file)
-                else:
-                        file_types["other"].append(file)
+                category = _EXT_CATEGORIES.get(os.path.splitext(file)[1].lower(), "other")
+                file_types[category].append(file)
 
         return file_types
 
@@ -151,41 +223,73 @@ class FileOrganizationSkill(Skill):
 
     def _execute_organization(self, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Execute organization plan."""
-        results = []
-
-        # Create directories (using shell tool for mkdir)
-        shell_tool = self.tool_registry.get("shell")
-        if shell_tool:
-                for dir_path in plan["create_dirs"]:
-                        result = shell_tool.execute(command=f"mkdir -p '{dir_path}'")
-                        results.append({
-                                "action": "create_dir",
-                                "path": dir_path,
-                                "success": "error" not in result,
-                                "details": result
-                        })
-
-        # Move files (using shell tool for mv)
-        if shell_tool:
-                for move in plan["move_files"]:
-                        result = shell_tool.execute(command=f"mv '{move['from']}' '{move['to']}'")
-                        results.append({
-                                "action": "move_file",
-                                "from": move["from"],
-                                "to": move["to"],
-                                "success": "error" not in result,
-                                "details": result
-                        })
-
-        # Delete files (using shell tool for rm)
-        if shell_tool:
-                for file_path in plan["delete_files"]:
-                        result = shell_tool.execute(command=f"rm '{file_path}'")
-                        results.append({
-                                "action": "delete_file",
-                                "path": file_path,
-                                "success": "error" not in result,
-                                "details": result
-                        })
+        # Filesystem calls made in-process instead of one shell fork/exec per file
+        create_ops = [
+                ({"action": "create_dir", "path": dir_path}, os.makedirs, (dir_path,), {"exist_ok": True})
+                for dir_path in plan["create_dirs"]
+        ]
+
+        # Moves and deletes share one open fd per directory, so each parent
+        # path is resolved once per batch rather than once per file
+        dir_fds: Dict[str, int] = {}
+        try:
+                with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                        # Phases run in order: directories exist before moves into them
+                        results = list(pool.map(self._run_op, create_ops))
+
+                        move_ops = []
+                        for move in plan["move_files"]:
+                                src, src_fd = self._at(dir_fds, move["from"])
+                                dst, dst_fd = self._at(dir_fds, move["to"])
+                                move_ops.append((
+                                        {"action": "move_file", "from": move["from"], "to": move["to"]},
+                                        _fast_move, (src, dst),
+                                        {"src_dir_fd": src_fd, "dst_dir_fd": dst_fd,
+                                         "src_path": move["from"], "dst_path": move["to"]}
+                                ))
+                        results.extend(pool.map(self._run_op, move_ops))
+
+                        delete_ops = []
+                        for file_path in plan["delete_files"]:
+                                name, fd = self._at(dir_fds, file_path)
+                                delete_ops.append((
+                                        {"action": "delete_file", "path": file_path},
+                                        os.unlink, (name,), {"dir_fd": fd}
+                                ))
+                        results.extend(pool.map(self._run_op, delete_ops))
+        finally:
+                for fd in dir_fds.values():
+                        os.close(fd)
 
         return results
+
+    @classmethod
+    def _run_op(cls, op) -> Dict[str, Any]:
+        """Run one planned operation and return its result record."""
+        record, operation, args, kwargs = op
+        return {**record, **cls._apply(operation, *args, **kwargs)}
+
+    @staticmethod
+    def _at(dir_fds: Dict[str, int], path: str) -> Tuple[str, Optional[int]]:
+        """Split path into a name and a cached fd for its parent directory."""
+        parent, name = os.path.split(path)
+        if not _DIR_FD_SUPPORTED or not name:
+                return path, None
+
+        fd = dir_fds.get(parent)
+        if fd is None:
+                try:
+                        fd = os.open(parent or ".", os.O_RDONLY | os.O_DIRECTORY)
+                except OSError:
+                        return path, None
+                dir_fds[parent] = fd
+        return name, fd
+
+    @staticmethod
+    def _apply(operation, *args, **kwargs) -> Dict[str, Any]:
+        """Run one filesystem operation and report it like a tool result."""
+        try:
+                operation(*args, **kwargs)
+        except OSError as e:
+                return {"success": False, "details": {"output": "", "error": str(e)}}
+        return {"success": True, "details": {"output": "", "error": ""}}
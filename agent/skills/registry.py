@@ -1,10 +1,23 @@
 """Skill registry for loading, managing, and discovering skills."""
 import os
 import importlib
+import pkgutil
+from collections import defaultdict
 from typing import Dict, Any, List, Optional, Set
+from dataclasses import dataclass
 from pathlib import Path
 from .base import Skill
 
+_BUILTIN_PACKAGE = "agent.skills.builtin"
+
+
+@dataclass(frozen=True, slots=True)
+class _TaskView:
+    """Minimal task shape used to probe skills with a bare goal string."""
+    goal: str
+    description: str = ""
+    search_text_lc: str = ""
+
 
 class SkillRegistry:
     """Registry for managing available skills."""
@@ -12,87 +25,137 @@ class SkillRegistry:
     def __init__(self, skills_dir: str = "agent/skills/builtin"):
         self.skills_dir = Path(skills_dir)
         self._skills: Dict[str, Skill] = {}
+        self._lower_triggers: Dict[str, List[str]] = {}
+        self._skills_by_tool: Dict[str, List[Skill]] = defaultdict(list)
         self._load_builtin_skills()
 
     def _load_builtin_skills(self):
-        """Load built-in skills from the builtin directory."""
+        """Find built-in skill modules; each is imported on first use."""
+        self._pending: Dict[str, Path] = {}
         if not self.skills_dir.exists():
                 return
 
-        # Import all Python files in builtin directory
-        for skill_file in self.skills_dir.glob("*.py"):
-                if skill_file.name.startswith("_"):
+        # pkgutil reuses the import system's cached directory listing
+        for module_info in pkgutil.iter_modules([str(self.skills_dir)]):
+                if module_info.ispkg or module_info.name.startswith("_"):
                         continue
-
-                try:
-                        module_name = f"agent.skills.builtin.{skill_file.stem}"
-                        module = importlib.import_module(module_name)
-
-                        # Look for skill classes (classes that inherit from Skill)
-                        for attr_name in dir(module):
-                                attr = getattr(module, attr_name)
-                                if (isinstance(attr, type) and
-                                        issubclass(attr, Skill) and
-                                        attr != Skill):
-                                        # Create instance
-                                        skill_instance = attr()
+                self._pending[module_info.name] = self.skills_dir / f"{module_info.name}.py"
+
+    def _import_skill_module(self, stem: str, skill_file: Path):
+        """Import one built-in skill module and register its skills."""
+        try:
+                module = importlib.import_module(f".{stem}", package=_BUILTIN_PACKAGE)
+
+                # Look for skill classes (classes that inherit from Skill)
+                for attr_name in dir(module):
+                        attr = getattr(module, attr_name)
+                        if (isinstance(attr, type) and
+                                issubclass(attr, Skill) and
+                                attr != Skill):
+                                # Create instance; explicitly registered skills win over built-ins
+                                skill_instance = attr()
+                                if skill_instance.name not in self._skills:
                                         self.register(skill_instance)
 
-                except (ImportError, AttributeError) as e:
-                        print(f"Failed to load skill from {skill_file}: {e}")
+        except (ImportError, AttributeError) as e:
+                print(f"Failed to load skill from {skill_file}: {e}")
+
+    def _ensure_loaded(self, name: str):
+        """Import the built-in module for a skill name if not loaded yet."""
+        if name in self._skills or not self._pending:
+                return
+
+        # Built-in modules are named after their skill; fall back to loading all
+        skill_file = self._pending.pop(name, None)
+        if skill_file is not None:
+                self._import_skill_module(name, skill_file)
+        if name not in self._skills:
+                self._ensure_all_loaded()
+
+    def _ensure_all_loaded(self):
+        """Import every pending built-in skill module."""
+        while self._pending:
+                stem = next(iter(self._pending))
+                self._import_skill_module(stem, self._pending.pop(stem))
 
     def register(self, skill: Skill):
         """Register a skill instance."""
+        # An explicit registration supersedes the built-in of the same name,
+        # so the pending module must not be imported (and re-register) later
+        self._pending.pop(skill.name, None)
+        if skill.name in self._skills:
+                self._unindex_tools(self._skills[skill.name])
         self._skills[skill.name] = skill
+        self._lower_triggers[skill.name] = [pattern.lower() for pattern in skill.trigger_patterns]
+        for tool_name in set(skill.required_tools):
+                self._skills_by_tool[tool_name].append(skill)
 
     def unregister(self, skill_name: str) -> bool:
         """Unregister a skill by name."""
+        self._ensure_loaded(skill_name)
         if skill_name in self._skills:
-                del self._skills[skill_name]
+                self._unindex_tools(self._skills.pop(skill_name))
+                del self._lower_triggers[skill_name]
                 return True
         return False
 
+    def _unindex_tools(self, skill: Skill):
+        """Drop a skill from the tool -> skills index."""
+        for tool_name in set(skill.required_tools):
+                skills = self._skills_by_tool.get(tool_name)
+                if skills is None:
+                        continue
+                skills.remove(skill)
+                if not skills:
+                        del self._skills_by_tool[tool_name]
+
     def get_skill(self, name: str) -> Optional[Skill]:
         """Get skill by name."""
+        self._ensure_loaded(name)
         return self._skills.get(name)
 
     def list_skills(self) -> List[Skill]:
         """List all registered skills."""
+        self._ensure_all_loaded()
         return list(self._skills.values())
 
     def find_matching_skills(self, task_goal: str, available_tools: Set[str]) -> List[Skill]:
         """Find skills that can handle a task and have required tools available."""
+        self._ensure_all_loaded()
         matching_skills = []
+        # Lowercase the goal once and share it across all skills
+        task = _TaskView(goal=task_goal, search_text_lc=f"{task_goal} ".lower())
 
+        # The cheap tool check runs first so trigger matching only sees usable skills
         for skill in self._skills.values():
-                if skill.can_handle_task(type('Task', (), {'goal': task_goal, 'description': ''})()):
-                        if skill.validate_requirements(available_tools):
+                if skill.validate_requirements(available_tools):
+                        if skill.can_handle_task(task):
                                 matching_skills.append(skill)
 
         return matching_skills
 
     def get_skill_names(self) -> List[str]:
         """Get list of all skill names."""
+        self._ensure_all_loaded()
         return list(self._skills.keys())
 
     def get_skills_by_tool(self, tool_name: str) -> List[Skill]:
         """Get skills that require a specific tool."""
-        return [skill for skill in self._skills.values()
-                        if tool_name in skill.get_required_tools()]
+        self._ensure_all_loaded()
+        return list(self._skills_by_tool.get(tool_name, ()))
 
     def get_skills_by_trigger(self, trigger_pattern: str) -> List[Skill]:
         """Get skills that match a trigger pattern."""
-        matching = []
-        for skill in self._skills.values():
-                for pattern in skill.trigger_patterns:
-                        if trigger_pattern.lower() in pattern.lower():
-                                matching.append(skill)
-                                break
-        return matching
+        self._ensure_all_loaded()
+        needle = trigger_pattern.lower()
+        return [skill for name, skill in self._skills.items()
+                        if any(needle in pattern for pattern in self._lower_triggers[name])]
 
     def reload_skills(self):
         """Reload all skills (useful for development)."""
         self._skills = {}
+        self._lower_triggers = {}
+        self._skills_by_tool = defaultdict(list)
         self._load_builtin_skills()
 
     def validate_skill_requirements(self, skill_name: str, available_tools: Set[str]) -> Dict[str, Any]:
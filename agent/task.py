@@ -1,5 +1,5 @@
 """Task model and state machine for persistent task management."""
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
@@ -15,7 +15,7 @@ class TaskStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """Single step in task execution history."""
     step_id: int
@@ -25,7 +25,7 @@ class Step:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """First-class task entity with persistence support."""
     id: int
@@ -35,11 +35,21 @@ class Task:
     updated_at: str
     steps: List[Dict[str, Any]] = field(default_factory=list)
     memory: Dict[str, Any] = field(default_factory=dict)
+    _search_text_lc: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_steps: bool = True) -> Dict[str, Any]:
         """Serialize to dictionary for JSON storage."""
-        data = asdict(self)
-        data["status"] = self.status.value
+        # Containers are copied one level deep so the result is a snapshot
+        data = {
+            "id": self.id,
+            "goal": self.goal,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "memory": dict(self.memory)
+        }
+        if include_steps:
+            data["steps"] = [dict(step) for step in self.steps]
         return data
 
     @classmethod
@@ -49,18 +59,26 @@ class Task:
             data["status"] = TaskStatus(data["status"])
         return cls(**data)
 
+    @property
+    def search_text_lc(self) -> str:
+        """Lowercased goal and description used for skill trigger matching."""
+        if self._search_text_lc is None:
+            self._search_text_lc = f"{self.goal} {getattr(self, 'description', '')}".lower()
+        return self._search_text_lc
+
     def add_step(self, action: str, result: Optional[str] = None, error: Optional[str] = None):
         """Add a step to the task history."""
         step_id = len(self.steps) + 1
-        step = Step(
-            step_id=step_id,
-            timestamp=datetime.utcnow().isoformat(),
-            action=action,
-            result=result,
-            error=error
-        )
-        self.steps.append(asdict(step))
-        self.updated_at = datetime.utcnow().isoformat()
+        now = datetime.utcnow().isoformat()
+        # Same keys as Step, built directly
+        self.steps.append({
+            "step_id": step_id,
+            "timestamp": now,
+            "action": action,
+            "result": result,
+            "error": error
+        })
+        self.updated_at = now
 
     def update_status(self, new_status: TaskStatus):
         """Transition task to new status."""
@@ -1,6 +1,7 @@
 """Tool execution registry for function calling."""
 from typing import Dict, Any, Callable, Optional
 from abc import ABC, abstractmethod
+import os
 import shlex
 import subprocess
 from pathlib import Path
@@ -62,7 +63,7 @@ class ShellTool(Tool):
         self.parameters = {
                 "command": {
                         "type": "string",
-                        "description": "Shell command to execute",
+                        "description": "Shell command to execute, or an argv list",
                         "required": True
                 }
         }
@@ -73,21 +74,23 @@ class ShellTool(Tool):
         if not command:
                 return {"error": "No command provided", "output": ""}
 
-        if command.lower().startswith("sudo") and not self.allow_sudo:
+        # An argv list skips the shlex pass; a string is split as before
+        head = command if isinstance(command, str) else command[0]
+        if head.lower().startswith("sudo") and not self.allow_sudo:
                 return {"error": "sudo execution not allowed", "output": ""}
 
         try:
-                parts = shlex.split(command)
+                parts = shlex.split(command) if isinstance(command, str) else list(command)
                 result = subprocess.run(
                         parts,
                         capture_output=True,
-                        timeout=self.timeout,
-                        text=True
+                        timeout=self.timeout
                 )
 
+                # Raw bytes captured; empty streams are never decoded
                 return {
-                        "output": result.stdout or "",
-                        "error": result.stderr or ""
+                        "output": result.stdout.decode("utf-8", "replace") if result.stdout else "",
+                        "error": result.stderr.decode("utf-8", "replace") if result.stderr else ""
                 }
 
         except subprocess.TimeoutExpired:
@@ -109,21 +112,43 @@ class FileReadTool(Tool):
                         "type": "string",
                         "description": "Path to file to read",
                         "required": True
+                },
+                "max_bytes": {
+                        "type": "integer",
+                        "description": "Read at most this many bytes (default: whole file)",
+                        "required": False
                 }
         }
 
     def execute(self, **kwargs) -> Dict[str, Any]:
         filepath = kwargs.get("filepath", "")
+        max_bytes = kwargs.get("max_bytes")
 
         try:
+                if max_bytes is not None:
+                        max_bytes = int(max_bytes)
+                        if max_bytes < 0:
+                                return {"error": "max_bytes must be non-negative", "output": ""}
+
                 path = Path(filepath)
                 if not path.exists():
                         return {"error": f"File not found: {filepath}", "output": ""}
 
-                with open(path, "r", encoding="utf-8") as f:
-                        content = f.read()
+                with open(path, "rb") as f:
+                        if max_bytes is None:
+                                data = f.read()
+                                truncated = False
+                        else:
+                                # One extra byte tells a file of exactly max_bytes from a longer one
+                                data = f.read(max_bytes + 1)
+                                truncated = len(data) > max_bytes
+                                data = data[:max_bytes]
 
-                return {"output": content, "error": ""}
+                return {
+                        "output": data.decode("utf-8", "replace"),
+                        "error": "",
+                        "truncated": truncated
+                }
 
         except Exception as e:
                 return {"error": str(e), "output": ""}
@@ -184,17 +209,16 @@ class ListDirTool(Tool):
         path = kwargs.get("path", ".")
 
         try:
-                dir_path = Path(path)
-                if not dir_path.exists():
-                        return {"error": f"Directory not found: {path}", "output": ""}
-
-                items = list(dir_path.iterdir())
-                names = sorted([item.name for item in items])
+                # Names come straight from the directory entries; no per-entry stat
+                with os.scandir(path) as it:
+                        names = sorted(entry.name for entry in it)
 
                 return {
                         "output": "\n".join(names),
                         "error": ""
                 }
 
+        except FileNotFoundError:
+                return {"error": f"Directory not found: {path}", "output": ""}
         except Exception as e:
                 return {"error": str(e), "output": ""}
\ No newline at end of file
@@ -1,45 +1,120 @@
 """CLI entrypoint for the personal agent."""
-import argparse
+import functools
+from collections import Counter
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Running from a checkout: make the repo root importable once
+_repo_root = str(Path(__file__).resolve().parent.parent)
+if _repo_root not in sys.path:
+    sys.path.insert(0, _repo_root)
 
-from agent.memory import TaskRepository
-from agent.engine import AgentEngine
-from agent.model_router import ModelRouter
-from agent.task import TaskStatus
 
+# Built on first use so each command only pays for what it touches;
+# agent modules are imported here rather than at the top of the CLI
+@functools.lru_cache(maxsize=None)
+def get_repo():
+    """Return the shared task repository."""
+    from agent.memory import TaskRepository
+    return TaskRepository()
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog="agent",
-        description="Personal autonomous AI agent - task-based core"
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
 
+@functools.lru_cache(maxsize=None)
+def get_router():
+    """Return the shared model router."""
+    from agent.model_router import ModelRouter
+    return ModelRouter()
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine():
+    """Return the shared agent engine."""
+    from agent.engine import AgentEngine
+    return AgentEngine(get_repo(), get_router())
+
+
+def _iris(cls_name: str):
+    """Return an IRIS command class, importing agent.iris_cli on first use."""
+    import importlib
+    return getattr(importlib.import_module("agent.iris_cli"), cls_name)
+
+
+_STATIC_HELP_TEXT = """usage: agent <command> [args]
+
+Personal autonomous AI agent - task-based core
+
+Commands:
+  help                Show this help message
+  add GOAL            Add a new task
+  list                List all tasks
+  run [--task ID]     Run next task
+  resume TASK_ID      Resume a paused task
+  pause TASK_ID       Pause a task
+  status              Show agent status
+  logs TASK_ID        Show task logs
+  auth                Authentication management
+  plugin              Plugin management
+  workers             Show worker status
+  stream TASK_ID      Stream task execution
+  iris-new GOAL       Create new IRIS task with .context
+  iris-list           List current IRIS task
+  iris-run TASK_ID    Run IRIS task with enforcement
+  iris-attach TASK_ID Attach to running IRIS task
+  iris-logs TASK_ID   View IRIS task execution logs
+
+Run 'agent <command> --help' for command options."""
+
+_HELP_ARGS = frozenset(("help", "-h", "--help"))
+
+# Keyed by TaskStatus value so the CLI needs no agent import to build it
+_STATUS_ICONS = {
+    "pending": "[ ]",
+    "running": "[*]",
+    "paused": "[P]",
+    "done": "[X]",
+    "error": "[!]"
+}
+
+
+def _build_help(subparsers):
     subparsers.add_parser("help", help="Show this help message")
 
+
+def _build_add(subparsers):
     add_parser = subparsers.add_parser("add", help="Add a new task")
     add_parser.add_argument("goal", help="Task goal (use quotes)")
 
+
+def _build_list(subparsers):
     subparsers.add_parser("list", help="List all tasks")
 
+
+def _build_run(subparsers):
     run_parser = subparsers.add_parser("run", help="Run next task")
     run_parser.add_argument("--task", type=int, help="Specific task ID to run")
 
+
+def _build_resume(subparsers):
     resume_parser = subparsers.add_parser("resume", help="Resume a paused task")
     resume_parser.add_argument("task_id", type=int, help="Task ID to resume")
 
+
+def _build_pause(subparsers):
     pause_parser = subparsers.add_parser("pause", help="Pause a task")
     pause_parser.add_argument("task_id", type=int, help="Task ID to pause")
 
+
+def _build_status(subparsers):
     subparsers.add_parser("status", help="Show agent status")
 
+
+def _build_logs(subparsers):
     logs_parser = subparsers.add_parser("logs", help="Show task logs")
     logs_parser.add_argument("task_id", type=int, help="Task ID to show logs for")
 
-    # Auth commands
+
+def _build_auth(subparsers):
     auth_parser = subparsers.add_parser("auth", help="Authentication management")
     auth_subparsers = auth_parser.add_subparsers(dest="auth_command")
 
@@ -47,21 +122,24 @@ def main():
     auth_login_parser.add_argument("provider", help="Provider name (e.g., openai)")
 
     auth_status_parser = auth_subparsers.add_parser("status", help="Check auth status")
+    auth_status_parser.add_argument("provider", nargs="?", default=None, help="Provider name (default: current)")
 
     auth_logout_parser = auth_subparsers.add_parser("logout", help="Logout from provider")
     auth_logout_parser.add_argument("provider", help="Provider name")
 
     auth_add_account_parser = auth_subparsers.add_parser("add-account", help="Add account for provider")
     auth_add_account_parser.add_argument("provider", help="Provider name")
-    auth_add_account_parser.add_argument("account-id", help="Account identifier")
+    auth_add_account_parser.add_argument("account_id", metavar="account-id", help="Account identifier")
     auth_add_account_parser.add_argument("--priority", type=int, default=1, help="Account priority (higher first)")
 
     auth_list_parser = auth_subparsers.add_parser("list", help="List all accounts")
+    auth_list_parser.add_argument("provider", nargs="?", default=None, help="Only list accounts for this provider")
 
     auth_rotate_parser = auth_subparsers.add_parser("rotate", help="Rotate to next available account")
     auth_rotate_parser.add_argument("provider", help="Provider name")
 
-    # Plugin commands
+
+def _build_plugin(subparsers):
     plugin_parser = subparsers.add_parser("plugin", help="Plugin management")
     plugin_subparsers = plugin_parser.add_subparsers(dest="plugin_command")
 
@@ -79,37 +157,135 @@ def main():
     plugin_disable_parser = plugin_subparsers.add_parser("disable", help="Disable a plugin")
     plugin_disable_parser.add_argument("name", help="Plugin name")
 
-    # Workers command
+
+def _build_workers(subparsers):
     workers_parser = subparsers.add_parser("workers", help="Show worker status")
 
-    # Stream command
+
+def _build_stream(subparsers):
     stream_parser = subparsers.add_parser("stream", help="Stream task execution")
     stream_parser.add_argument("task_id", type=int, help="Task ID to stream")
 
-    # IRIS commands
+
+def _build_iris_new(subparsers):
     iris_parser = subparsers.add_parser("iris-new", help="Create new IRIS task with .context")
     iris_parser.add_argument("goal", help="Task goal (use quotes)")
 
+
+def _build_iris_list(subparsers):
     iris_list_parser = subparsers.add_parser("iris-list", help="List current IRIS task")
 
+
+def _build_iris_run(subparsers):
     iris_run_parser = subparsers.add_parser("iris-run", help="Run IRIS task with enforcement")
     iris_run_parser.add_argument("task_id", help="IRIS task ID to run")
 
+
+def _build_iris_attach(subparsers):
     iris_attach_parser = subparsers.add_parser("iris-attach", help="Attach to running IRIS task")
     iris_attach_parser.add_argument("task_id", help="IRIS task ID to attach to")
 
+
+def _build_iris_logs(subparsers):
     iris_logs_parser = subparsers.add_parser("iris-logs", help="View IRIS task execution logs")
     iris_logs_parser.add_argument("task_id", help="IRIS task ID to view logs for")
 
-    args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
+# Command name -> parser builder, in help order
+_PARSER_BUILDERS = {
+    "help": _build_help,
+    "add": _build_add,
+    "list": _build_list,
+    "run": _build_run,
+    "resume": _build_resume,
+    "pause": _build_pause,
+    "status": _build_status,
+    "logs": _build_logs,
+    "auth": _build_auth,
+    "plugin": _build_plugin,
+    "workers": _build_workers,
+    "stream": _build_stream,
+    "iris-new": _build_iris_new,
+    "iris-list": _build_iris_list,
+    "iris-run": _build_iris_run,
+    "iris-attach": _build_iris_attach,
+    "iris-logs": _build_iris_logs
+}
+
+
+# Commands with a fixed positional shape: name -> (positional args, defaults)
+_SIMPLE_COMMANDS = {
+    "add": (("goal",), {}),
+    "list": ((), {}),
+    "run": ((), {"task": None}),
+    "resume": (("task_id",), {}),
+    "pause": (("task_id",), {}),
+    "status": ((), {}),
+    "logs": (("task_id",), {}),
+    "workers": ((), {}),
+    "stream": (("task_id",), {})
+}
+
+_INT_ARGS = frozenset(("task_id",))
+
+
+def _parse_simple(argv):
+    """Parse a plain invocation of a simple command without argparse.
+
+    Returns None for options, wrong arity or bad values so argparse can
+    handle them and report errors.
+    """
+    spec = _SIMPLE_COMMANDS.get(argv[0])
+    if spec is None:
+        return None
+
+    names, defaults = spec
+    values = argv[1:]
+    if len(values) != len(names) or any(value.startswith("-") for value in values):
+        return None
+
+    args = SimpleNamespace(command=argv[0], **defaults)
+    for name, value in zip(names, values):
+        if name in _INT_ARGS:
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        setattr(args, name, value)
+    return args
+
+
+def main():
+    # Plain help needs none of the subparsers below
+    argv = sys.argv[1:]
+    if not argv or (len(argv) == 1 and argv[0] in _HELP_ARGS):
+        print(_STATIC_HELP_TEXT)
         return 0
 
-    repo = TaskRepository()
-    router = ModelRouter()
-    engine = AgentEngine(repo, router)
+    args = _parse_simple(argv)
+    if args is None:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            prog="agent",
+            description="Personal autonomous AI agent - task-based core"
+        )
+        subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+        # Only the invoked command's parser is built; anything else (typos,
+        # global options) builds them all so argparse reports choices properly
+        builder = _PARSER_BUILDERS.get(argv[0])
+        if builder is not None:
+            builder(subparsers)
+        else:
+            for build in _PARSER_BUILDERS.values():
+                build(subparsers)
+
+        args = parser.parse_args()
+
+        if not args.command:
+            parser.print_help()
+            return 0
 
     if args.command == "auth":
         if args.auth_command == "login":
@@ -119,10 +295,11 @@ def main():
                 print("  2. Wait for callback")
                 print("  3. Store tokens securely")
         elif args.auth_command == "status":
-                provider_name = getattr(args, 'provider', None)
+                provider_name = args.provider
                 if provider_name:
                         print(f"Auth status for {provider_name}")
                 else:
+                        router = get_router()
                         provider = router.get_provider()
                         print(f"Default provider: {router.get_default_provider()}")
                         print(f"Auth type: {provider.auth_type}")
@@ -137,23 +314,24 @@ def main():
                 account_mgr = AccountManager()
                 success = account_mgr.add_account(
                         args.provider,
-                        getattr(args, 'account-id'),
+                        args.account_id,
                         {
                                 "type": "oauth_token",
                                 "token": "stub_token"
                         },
-                        getattr(args, 'priority', 1)
+                        args.priority
                 )
                 if success:
-                        print(f"Account {getattr(args, 'account-id')} added to {args.provider}")
+                        print(f"Account {args.account_id} added to {args.provider}")
                 else:
                         print("Failed to add account")
                 return 0
 
         elif args.auth_command == "list":
+                import time
                 from agent.auth.accounts import AccountManager
                 account_mgr = AccountManager()
-                provider_name = getattr(args, 'provider', None)
+                provider_name = args.provider
                 accounts = account_mgr.list_accounts(provider_name)
 
                 if not accounts:
@@ -161,8 +339,9 @@ def main():
                         return 0
 
                 print(f"Accounts ({len(accounts)}):")
+                now = time.time()
                 for account in accounts:
-                        cooldown_status = "in cooldown" if account.get("cooldown_until", 0) > time.time() else "available"
+                        cooldown_status = "in cooldown" if account["cooldown_until"] > now else "available"
                         print(f"  {account['account_id']}: priority={account['priority']}, last_used={account.get('last_used', 'never')}, {cooldown_status}")
                 return 0
 
@@ -172,7 +351,7 @@ def main():
                 account_mgr = AccountManager()
                 rotator = AccountRotator(account_mgr)
 
-                provider_name = getattr(args, 'provider', None)
+                provider_name = args.provider
                 if not provider_name:
                         print("Provider name required for rotate")
                         return 0
@@ -187,127 +366,123 @@ def main():
                 return 0
 
     if args.command == "workers":
-        workers = engine.get_worker_status()
+        workers = get_engine().get_worker_status()
         print(f"Workers ({len(workers)}):")
         for worker in workers:
                 print(f"  Worker {worker['worker_id']}: {worker['status']}")
         return 0
 
     if args.command == "stream":
-        task = repo.get(args.task_id)
+        task = get_repo().get(args.task_id)
         if not task:
                 print(f"Task {args.task_id} not found")
                 return 1
 
-        print(f"Streaming task {task.id}: {task.goal}")
-        print(f"Status: {task.status.value}")
-        print(f"\nSteps: {len(task.steps)}")
-        print("Execution log:\n")
+        # Whole log formatted first and written once
+        buf = [
+                f"Streaming task {task.id}: {task.goal}\n",
+                f"Status: {task.status.value}\n",
+                f"\nSteps: {len(task.steps)}\n",
+                "Execution log:\n\n"
+        ]
 
         for step in task.steps:
-                print(f"[{step['action'].upper()}] {step['timestamp']}")
-                if step.get('result'):
-                        print(f"  Result: {step['result'][:200]}{'...' if len(step.get('result', '')) > 200 else ''}")
+                buf.append(f"[{step['action'].upper()}] {step['timestamp']}\n")
+                result = step.get('result')
+                if result:
+                        buf.append(f"  Result: {result[:200]}{'...' if len(result) > 200 else ''}\n")
                 if step.get('error'):
-                        print(f"  Error: {step['error']}")
+                        buf.append(f"  Error: {step['error']}\n")
+        sys.stdout.write("".join(buf))
         return 0
 
     if args.command == "add":
-        task = repo.create(args.goal)
+        task = get_repo().create(args.goal)
         print(f"Task {task.id} added: {task.goal}")
 
     elif args.command == "list":
-        tasks = repo.list_all()
+        tasks = get_repo().list_all()
         if not tasks:
             print("No tasks")
             return 0
 
         print("Tasks:")
         for task in tasks:
-            status_icon = {
-                TaskStatus.PENDING: "[ ]",
-                TaskStatus.RUNNING: "[*]",
-                TaskStatus.PAUSED: "[P]",
-                TaskStatus.DONE: "[X]",
-                TaskStatus.ERROR: "[!]"
-            }.get(task.status, "[?]")
+            status_icon = _STATUS_ICONS.get(task.status.value, "[?]")
             print(f"  {status_icon} {task.id}: {task.goal} ({task.status.value})")
 
     elif args.command == "run":
-        task = engine.run_single_task(args.task)
+        task = get_engine().run_single_task(args.task)
         if task:
             print(f"Task {task.id} finished with status: {task.status.value}")
 
     elif args.command == "resume":
-        task = engine.resume_task(args.task_id)
+        task = get_engine().resume_task(args.task_id)
         if task:
             print(f"Task {task.id} resumed and finished with status: {task.status.value}")
 
     elif args.command == "pause":
-        engine.pause_task(args.task_id)
+        get_engine().pause_task(args.task_id)
 
     elif args.command == "status":
-        tasks = repo.list_all()
+        tasks = get_repo().list_all()
         if not tasks:
             print("No tasks")
             return 0
 
-        status_counts = {}
-        for task in tasks:
-            status_counts[task.status.value] = status_counts.get(task.status.value, 0) + 1
+        status_counts = Counter(task.status.value for task in tasks)
 
         print("Agent Status:")
         for status, count in sorted(status_counts.items()):
             print(f"  {status}: {count}")
 
     elif args.command == "logs":
-        task = repo.get(args.task_id)
+        task = get_repo().get(args.task_id)
         if not task:
             print(f"Task {args.task_id} not found")
             return 1
 
-        print(f"Task {task.id}: {task.goal}")
-        print(f"Status: {task.status.value}")
-        print(f"Steps: {len(task.steps)}")
-        print()
+        buf = [
+            f"Task {task.id}: {task.goal}\n",
+            f"Status: {task.status.value}\n",
+            f"Steps: {len(task.steps)}\n",
+            "\n"
+        ]
 
         if not task.steps:
-            print("No steps recorded")
+            buf.append("No steps recorded\n")
+            sys.stdout.write("".join(buf))
             return 0
 
-        print("Execution log:")
+        buf.append("Execution log:\n")
         for step in task.steps:
-            print(f"\n[Step {step['step_id']}] {step['timestamp']}")
-            print(f"  Action: {step['action']}")
+            buf.append(f"\n[Step {step['step_id']}] {step['timestamp']}\n")
+            buf.append(f"  Action: {step['action']}\n")
             if step.get('result'):
-                print(f"  Result: {step['result']}")
+                buf.append(f"  Result: {step['result']}\n")
             if step.get('error'):
-                 print(f"  Error: {step['error']}")
+                buf.append(f"  Error: {step['error']}\n")
+        sys.stdout.write("".join(buf))
 
     # IRIS commands
     elif args.command == "iris-new":
-        from agent.iris_cli import IRISNewCommand
-        cmd = IRISNewCommand()
+        cmd = _iris("IRISNewCommand")()
         cmd.execute(args.goal)
 
     elif args.command == "iris-list":
-        from agent.iris_cli import IRISListCommand
-        cmd = IRISListCommand()
+        cmd = _iris("IRISListCommand")()
         cmd.execute()
 
     elif args.command == "iris-run":
-        from agent.iris_cli import IRISRunCommand
-        cmd = IRISRunCommand()
+        cmd = _iris("IRISRunCommand")()
         cmd.execute(args.task_id)
 
     elif args.command == "iris-attach":
-        from agent.iris_cli import IRISAttachCommand
-        cmd = IRISAttachCommand()
+        cmd = _iris("IRISAttachCommand")()
         cmd.execute(args.task_id)
 
     elif args.command == "iris-logs":
-        from agent.iris_cli import IRISLogsCommand
-        cmd = IRISLogsCommand()
+        cmd = _iris("IRISLogsCommand")()
         cmd.execute(args.task_id)
 
     return 0
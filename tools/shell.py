@@ -1,53 +1,84 @@
 """Controlled shell execution tool."""
-from typing import Tuple, Optional
-from pathlib import Path
+import functools
+import re
+import subprocess
+from typing import List, Tuple, Optional, Union
+
+# Anchored prefix test; no lowercased copy of the whole command
+_SUDO_RE = re.compile(r"\s*sudo", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _split_cached(command: str) -> Tuple[str, ...]:
+    """Tokenize a command string, reusing results for repeated commands."""
+    import shlex
+    return tuple(shlex.split(command))
+
+
+def _failure(
+    code: int,
+    message: str,
+    binary: bool
+) -> Tuple[int, Union[str, bytes], Union[str, bytes]]:
+    """Build an error result in the same str/bytes form as a successful run."""
+    if binary:
+        return code, b"", message.encode("utf-8")
+    return code, "", message
 
 
 def execute_command(
-    command: str,
+    command: Union[str, List[str]],
     working_dir: Optional[str] = None,
     timeout: int = 30,
-    allow_sudo: bool = False
-) -> Tuple[int, str, Optional[str]]:
+    allow_sudo: bool = False,
+    binary: bool = False
+) -> Tuple[int, Union[str, bytes], Optional[Union[str, bytes]]]:
     """
     Execute shell command with safety controls.
 
     Args:
-        command: Shell command to execute
+        command: Shell command to execute, or an already tokenized argv list
         working_dir: Directory to execute in (default: current)
         timeout: Maximum execution time in seconds
         allow_sudo: Whether sudo commands are allowed
+        binary: Return raw stdout/stderr bytes instead of decoded text;
+            error messages are then UTF-8 encoded as well
 
     Returns:
         (exit_code, stdout, stderr)
     """
-    import subprocess
-    import shlex
-
-    if command.lower().startswith("sudo") and not allow_sudo:
-        return 1, "", "sudo execution not allowed"
+    head = command if isinstance(command, str) else (command[0] if command else "")
+    if not allow_sudo and _SUDO_RE.match(head):
+        return _failure(1, "sudo execution not allowed", binary)
 
-    workdir = Path(working_dir) if working_dir else Path.cwd()
+    # cwd=None lets the child inherit the current directory without a lookup
+    workdir = str(working_dir) if working_dir else None
 
     try:
-        parts = shlex.split(command)
+        parts = _split_cached(command) if isinstance(command, str) else command
+        if not parts:
+            return _failure(1, "No command provided", binary)
         result = subprocess.run(
             parts,
-            cwd=str(workdir),
+            cwd=workdir,
             capture_output=True,
             timeout=timeout,
-            text=True
+            # Text mode never fails on undecodable output; binary skips decoding
+            encoding=None if binary else "utf-8",
+            errors=None if binary else "replace"
         )
 
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-        return result.returncode, stdout, stderr
+        # capture_output always yields str/bytes, never None
+        return result.returncode, result.stdout, result.stderr
 
     except subprocess.TimeoutExpired:
-        return -1, "", f"Command timed out after {timeout}s"
+        return _failure(-1, f"Command timed out after {timeout}s", binary)
     except FileNotFoundError:
-        return 127, "", "Command not found"
+        return _failure(127, "Command not found", binary)
     except PermissionError:
-        return 126, "", "Permission denied"
-    except Exception as e:
-        return -1, "", str(e)
+        return _failure(126, "Permission denied", binary)
+    except OSError as e:
+        return _failure(-1, f"OS error: {e}", binary)
+    except ValueError as e:
+        # Malformed command string, e.g. an unclosed quote
+        return _failure(-1, f"Invalid command: {e}", binary)